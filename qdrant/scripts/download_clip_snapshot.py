@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Download a CLIP snapshot for offline use via CLIP_MODEL_PATH.
+
+Only the config, processor files and safetensors weights are fetched. Copy
+the resulting directory to hosts without hub access and point
+CLIP_MODEL_PATH at it.
+"""
+
+import argparse
+import sys
+
+ALLOW_PATTERNS = ["*.json", "*.txt", "*.safetensors"]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model", default="openai/clip-vit-large-patch14",
+                        help="Hub model id")
+    parser.add_argument("--revision", default=None,
+                        help="Commit hash or tag to pin")
+    parser.add_argument("--output-dir", required=True,
+                        help="Directory to write the snapshot to")
+    args = parser.parse_args()
+
+    from huggingface_hub import snapshot_download
+
+    path = snapshot_download(
+        args.model,
+        revision=args.revision,
+        local_dir=args.output_dir,
+        allow_patterns=ALLOW_PATTERNS
+    )
+    print(f"Snapshot of {args.model} written to {path}")
+    print(f"Use it with: CLIP_MODEL={args.model} CLIP_MODEL_PATH={path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,53 @@
 """Vector search engine for IKEA products using Qdrant and CLIP/OpenAI embeddings."""
 
-from .core.search_engine import VectorSearchEngine
-from .core.embedders import CLIPEmbedder, OpenAIEmbedder
-from .core.qdrant_client import QdrantManager
-from .data.product_loader import ProductLoader
-from .utils.config import Config
-from .utils.logger import setup_logger
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .core.search_engine import VectorSearchEngine
+    from .core.async_search_engine import AsyncVectorSearchEngine
+    from .core.embedders import CLIPEmbedder, OpenAIEmbedder
+    from .core.qdrant_client import QdrantManager
+    from .core.filters import ProductFilter
+    from .data.product_loader import ProductLoader
+    from .utils.config import Config
+    from .utils.logger import setup_logger
 
 __version__ = "1.0.0"
 __all__ = [
     "VectorSearchEngine",
+    "AsyncVectorSearchEngine",
     "CLIPEmbedder", 
     "OpenAIEmbedder",
     "QdrantManager",
+    "ProductFilter",
     "ProductLoader",
     "Config",
     "setup_logger"
 ]
+
+# Exports are resolved on first access so that importing the package does
+# not pull in torch, transformers, openai or qdrant_client.
+_EXPORTS = {
+    "VectorSearchEngine": ".core.search_engine",
+    "AsyncVectorSearchEngine": ".core.async_search_engine",
+    "CLIPEmbedder": ".core.embedders",
+    "OpenAIEmbedder": ".core.embedders",
+    "QdrantManager": ".core.qdrant_client",
+    "ProductFilter": ".core.filters",
+    "ProductLoader": ".data.product_loader",
+    "Config": ".utils.config",
+    "setup_logger": ".utils.logger",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,7 @@
+"""Benchmarks for choosing embedding and search settings."""
+
+from .clip_modes import compare_inference_modes
+from .quantization import compare_quantization
+from .transport import compare_transports
+
+__all__ = ["compare_inference_modes", "compare_quantization", "compare_transports"]
@@ -0,0 +1,69 @@
+"""Throughput and accuracy comparison of CLIP inference modes."""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from PIL import Image
+
+from ..core.embedders import CLIPEmbedder
+
+logger = logging.getLogger(__name__)
+
+
+def compare_inference_modes(
+    images: Sequence[Image.Image],
+    modes: Sequence[str] = CLIPEmbedder.INFERENCE_MODES,
+    model_name: str = "openai/clip-vit-large-patch14",
+    batch_size: int = 16,
+    num_threads: Optional[int] = None,
+    model_path: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Embed a sample set in each mode and compare against fp32.
+
+    Returns one row per mode with its throughput and the cosine similarity
+    between its embeddings and the fp32 embeddings of the same images.
+    """
+    modes = ["fp32"] + [mode for mode in modes if mode != "fp32"]
+    baseline = None
+    report = []
+
+    for mode in modes:
+        embedder = CLIPEmbedder(
+            model_name, inference_mode=mode, num_threads=num_threads, towers="vision",
+            model_path=model_path
+        )
+        if embedder.inference_mode != mode:
+            logger.warning(f"Skipping {mode}: not supported on this host")
+            continue
+
+        # Warm up kernels and allocator before timing
+        embedder.get_image_embeddings(list(images[:batch_size]))
+
+        batches = []
+        valid: List[bool] = []
+        start = time.perf_counter()
+        for offset in range(0, len(images), batch_size):
+            embeddings, ok = embedder.get_image_embeddings(list(images[offset:offset + batch_size]))
+            batches.append(embeddings)
+            valid.extend(ok)
+        elapsed = time.perf_counter() - start
+
+        embeddings = np.vstack(batches)
+        if baseline is None:
+            baseline, baseline_valid = embeddings, valid
+
+        mask = np.array(valid) & np.array(baseline_valid)
+        cosine = np.sum(embeddings[mask] * baseline[mask], axis=1)
+        report.append({
+            "mode": mode,
+            "images_per_sec": len(images) / elapsed if elapsed else float("inf"),
+            "mean_cosine": float(cosine.mean()) if cosine.size else float("nan"),
+            "min_cosine": float(cosine.min()) if cosine.size else float("nan")
+        })
+        logger.info(f"{mode}: {report[-1]['images_per_sec']:.1f} images/sec")
+
+        del embedder
+
+    return report
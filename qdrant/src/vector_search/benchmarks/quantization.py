@@ -0,0 +1,134 @@
+"""Recall and latency of quantized Qdrant collections against an unquantized baseline."""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..core.qdrant_client import QdrantManager
+
+logger = logging.getLogger(__name__)
+
+MODES = ("none", "scalar", "product", "binary")
+
+
+def vector_bytes(mode: str, vector_size: int) -> float:
+    """In-memory size of one vector under a quantization mode."""
+    return {
+        "none": 4 * vector_size,
+        "scalar": vector_size,
+        "product": 4 * vector_size / 16,
+        "binary": vector_size / 8
+    }[mode]
+
+
+def compare_quantization(
+    url: str,
+    api_key: Optional[str] = None,
+    qdrant_options: Optional[Dict[str, Any]] = None,
+    modes: Sequence[str] = MODES,
+    source_collection: Optional[str] = None,
+    vector_size: int = 768,
+    num_points: int = 20000,
+    num_queries: int = 200,
+    limit: int = 10,
+    rescore: bool = True,
+    oversampling: Optional[float] = 2.0,
+    on_disk: bool = True,
+    index_timeout: float = 600
+) -> List[Dict[str, Any]]:
+    """Search the same vectors under each quantization mode.
+
+    Vectors come from ``source_collection`` (held-out points are the
+    queries) or are random. Each mode gets its own scratch collection,
+    indexed before searching and deleted afterwards; quantized modes keep
+    the original vectors on disk when ``on_disk``. Recall@``limit`` is
+    measured against exact nearest neighbours computed here, so "none" shows
+    the loss from HNSW alone.
+
+    Returns one row per mode with recall, search latency percentiles and
+    the estimated RAM taken by vectors.
+    """
+    qdrant = QdrantManager(url, api_key, **(qdrant_options or {}))
+    vectors, queries = _load_vectors(qdrant, source_collection, vector_size, num_points, num_queries)
+    truth = _exact_neighbours(vectors, queries, limit)
+    vector_size = vectors.shape[1]
+    report = []
+
+    for mode in modes:
+        collection_name = f"_benchmark_quantization_{mode}"
+        quantization = None if mode == "none" else mode
+        qdrant.recreate_collection(
+            collection_name, vector_size, bulk_load=True,
+            quantization=quantization, on_disk=on_disk and quantization is not None
+        )
+
+        try:
+            with qdrant.bulk_uploader(collection_name) as uploader:
+                uploader.add(list(range(len(vectors))), vectors, [{} for _ in range(len(vectors))])
+            # Index every segment, however small, so searches hit HNSW and
+            # the quantized vectors
+            if not qdrant.finish_bulk_load(collection_name, index_timeout, indexing_threshold=1):
+                raise RuntimeError(f"{collection_name} was not indexed within {index_timeout}s")
+
+            options = {"rescore": rescore, "oversampling": oversampling} if quantization else {}
+            qdrant.search(collection_name, queries[0], limit=limit, **options)
+
+            latencies = []
+            hits = 0
+            for query, expected in zip(queries, truth):
+                start = time.perf_counter()
+                results = qdrant.search(collection_name, query, limit=limit, **options)
+                latencies.append((time.perf_counter() - start) * 1000)
+                hits += len(expected.intersection(result["id"] for result in results))
+        finally:
+            qdrant.delete_collection(collection_name)
+
+        ram_bytes = vector_bytes(mode, vector_size)
+        if quantization and not on_disk:
+            ram_bytes += vector_bytes("none", vector_size)
+        report.append({
+            "mode": mode,
+            "recall": hits / (len(queries) * limit),
+            "p50_ms": float(np.percentile(latencies, 50)),
+            "p95_ms": float(np.percentile(latencies, 95)),
+            "vector_ram_mb": len(vectors) * ram_bytes / 1024 ** 2
+        })
+        logger.info(f"{mode}: recall@{limit} {report[-1]['recall']:.3f}")
+
+    return report
+
+
+def _load_vectors(
+    qdrant: QdrantManager,
+    source_collection: Optional[str],
+    vector_size: int,
+    num_points: int,
+    num_queries: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    if source_collection is None:
+        rng = np.random.default_rng(0)
+        vectors = rng.standard_normal((num_points, vector_size), dtype=np.float32)
+        return vectors, rng.standard_normal((num_queries, vector_size), dtype=np.float32)
+
+    wanted = num_points + num_queries
+    rows = []
+    for points in qdrant.iter_points(source_collection, with_payload=False, with_vectors=True):
+        rows.extend(point.vector for point in points)
+        if len(rows) >= wanted:
+            break
+
+    if len(rows) <= num_queries:
+        raise ValueError(f"{source_collection} has too few points for {num_queries} queries")
+    matrix = np.asarray(rows[:wanted], dtype=np.float32)
+    return matrix[num_queries:], matrix[:num_queries]
+
+
+def _exact_neighbours(vectors: np.ndarray, queries: np.ndarray, limit: int) -> List[set]:
+    # Collections use cosine distance, i.e. dot products of normalized vectors
+    vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    scores = queries @ vectors.T
+    top = np.argpartition(-scores, limit - 1, axis=1)[:, :limit]
+    return [set(row.tolist()) for row in top]
@@ -0,0 +1,75 @@
+"""Latency and upsert throughput comparison of Qdrant REST and gRPC transports."""
+
+import logging
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ..core.qdrant_client import QdrantManager
+
+logger = logging.getLogger(__name__)
+
+TRANSPORTS = ("rest", "grpc")
+
+
+def compare_transports(
+    url: str,
+    api_key: Optional[str] = None,
+    transports: Sequence[str] = TRANSPORTS,
+    vector_size: int = 768,
+    num_points: int = 5000,
+    batch_size: int = 256,
+    num_queries: int = 200,
+    grpc_port: int = 6334
+) -> List[Dict[str, Any]]:
+    """Upsert and search random vectors over each transport.
+
+    Each transport gets its own scratch collection, deleted afterwards.
+    Returns one row per transport with upsert throughput and search latency
+    percentiles.
+    """
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((num_points, vector_size), dtype=np.float32)
+    queries = rng.standard_normal((num_queries, vector_size), dtype=np.float32)
+    payloads = [{"product_id": str(i), "price": float(i % 500)} for i in range(num_points)]
+    report = []
+
+    for transport in transports:
+        qdrant = QdrantManager(url, api_key, prefer_grpc=transport == "grpc", grpc_port=grpc_port)
+        collection_name = f"_benchmark_transport_{transport}"
+        qdrant.recreate_collection(collection_name, vector_size)
+
+        try:
+            start = time.perf_counter()
+            for offset in range(0, num_points, batch_size):
+                batch = slice(offset, offset + batch_size)
+                qdrant.upsert_vectors(
+                    collection_name,
+                    [str(uuid.uuid4()) for _ in payloads[batch]],
+                    vectors[batch],
+                    payloads[batch]
+                )
+            upsert_elapsed = time.perf_counter() - start
+
+            # Warm up the connection before timing searches
+            qdrant.search(collection_name, queries[0], limit=10)
+
+            latencies = []
+            for query in queries:
+                start = time.perf_counter()
+                qdrant.search(collection_name, query, limit=10)
+                latencies.append((time.perf_counter() - start) * 1000)
+        finally:
+            qdrant.delete_collection(collection_name)
+
+        report.append({
+            "transport": transport,
+            "points_per_sec": num_points / upsert_elapsed if upsert_elapsed else float("inf"),
+            "p50_ms": float(np.percentile(latencies, 50)),
+            "p95_ms": float(np.percentile(latencies, 95))
+        })
+        logger.info(f"{transport}: {report[-1]['points_per_sec']:.0f} points/sec")
+
+    return report
@@ -1,9 +1,13 @@
 """Main CLI interface for the vector search engine."""
 
 import argparse
+import itertools
 import sys
 from pathlib import Path
 
+from ..core.ef_tuning import EF_CANDIDATES, tune_hnsw_ef
+from ..core.filters import PAYLOAD_INDEXES, ProductFilter
+from ..core.qdrant_client import QdrantManager
 from ..core.search_engine import VectorSearchEngine
 from ..data.product_loader import ProductLoader
 from ..utils.config import Config
@@ -12,6 +16,46 @@ from ..utils.logger import setup_logger
 logger = setup_logger()
 
 
+def load_products(args, search_engine):
+    """Products for a build, or None if there are none.
+    
+    A Qdrant source is streamed while the build runs, unless it is also the
+    target collection, which the build recreates; then it is read up front.
+    """
+    if args.source == "json":
+        products = ProductLoader.load_from_json(args.input_file)
+    elif args.source_collection != args.collection:
+        if not search_engine.qdrant.collection_exists(args.source_collection):
+            return None
+        products = ProductLoader.iter_from_qdrant(
+            search_engine.qdrant, args.source_collection, parallel=args.scroll_workers
+        )
+        # Peek before the target is recreated, so an empty source fails
+        # instead of leaving an empty collection behind
+        first = next(products, None)
+        if first is None:
+            return None
+        return itertools.chain([first], products)
+    else:
+        products = ProductLoader.load_from_qdrant(search_engine.qdrant, args.source_collection)
+    
+    return products or None
+
+
+def finish_bulk_load(args, search_engine):
+    """Index a --bulk-load build, giving up after --index-timeout seconds."""
+    logger.info(f"Waiting up to {args.index_timeout:g}s for {args.collection} to be indexed")
+    if search_engine.qdrant.finish_bulk_load(args.collection, timeout=args.index_timeout):
+        return True
+    
+    logger.error(
+        f"{args.collection} was not indexed within {args.index_timeout:g}s; its points are "
+        f"stored and Qdrant keeps indexing them. Check the collection status, or rebuild "
+        f"with a larger --index-timeout"
+    )
+    return False
+
+
 def build_text_embeddings(args):
     try:
         Config.validate()
@@ -19,30 +63,53 @@ def build_text_embeddings(args):
         search_engine = VectorSearchEngine(
             qdrant_url=Config.QDRANT_URL,
             qdrant_api_key=Config.QDRANT_API_KEY,
-            openai_api_key=Config.OPENAI_API_KEY
+            qdrant_options=Config.qdrant_options(),
+            openai_api_key=Config.OPENAI_API_KEY,
+            embedding_cache_dir=Config.EMBEDDING_CACHE_DIR,
+            embedding_cache_max_bytes=Config.EMBEDDING_CACHE_MAX_BYTES,
+            upsert_parallel=Config.UPSERT_PARALLEL,
+            upsert_batch_bytes=Config.UPSERT_BATCH_BYTES,
+            openai_concurrent=args.concurrent,
+            openai_requests_per_minute=Config.OPENAI_REQUESTS_PER_MINUTE,
+            openai_tokens_per_minute=Config.OPENAI_TOKENS_PER_MINUTE,
+            openai_max_concurrency=Config.OPENAI_MAX_CONCURRENCY,
+            clip_inference_mode=Config.CLIP_INFERENCE_MODE,
+            clip_num_threads=Config.CLIP_NUM_THREADS,
+            clip_towers=Config.CLIP_TOWERS or None,
+            clip_model_name=Config.CLIP_MODEL,
+            clip_model_path=Config.CLIP_MODEL_PATH or None
         )
         
-        if args.source == "json":
-            products = ProductLoader.load_from_json(args.input_file)
-        else:
-            products = ProductLoader.load_from_qdrant(
-                search_engine.qdrant, args.source_collection
-            )
-        
-        if not products:
+        products = load_products(args, search_engine)
+        if products is None:
             logger.error("No products loaded")
             return 1
         
+        if args.backend == "clip":
+            vector_size = search_engine.get_text_embedder("clip").projection_dim
+        else:
+            vector_size = Config.VECTOR_SIZE_TEXT
+        
         search_engine.qdrant.recreate_collection(
             args.collection, 
-            Config.VECTOR_SIZE_TEXT
+            vector_size,
+            bulk_load=args.bulk_load,
+            quantization=args.quantization,
+            on_disk=args.on_disk
         )
         
-        processed_count = search_engine.build_text_embeddings(
-            products, 
-            args.collection, 
-            args.batch_size
-        )
+        try:
+            processed_count = search_engine.build_text_embeddings(
+                products, 
+                args.collection, 
+                args.batch_size,
+                backend=args.backend
+            )
+        finally:
+            indexed = not args.bulk_load or finish_bulk_load(args, search_engine)
+        
+        if not indexed:
+            return 1
         
         logger.info(f"Successfully processed {processed_count} products")
         return 0
@@ -59,33 +126,50 @@ def build_image_embeddings(args):
         search_engine = VectorSearchEngine(
             qdrant_url=Config.QDRANT_URL,
             qdrant_api_key=Config.QDRANT_API_KEY,
-            openai_api_key=Config.OPENAI_API_KEY
+            qdrant_options=Config.qdrant_options(),
+            openai_api_key=Config.OPENAI_API_KEY,
+            embedding_cache_dir=Config.EMBEDDING_CACHE_DIR,
+            embedding_cache_max_bytes=Config.EMBEDDING_CACHE_MAX_BYTES,
+            upsert_parallel=Config.UPSERT_PARALLEL,
+            upsert_batch_bytes=Config.UPSERT_BATCH_BYTES,
+            image_cache_dir=Config.IMAGE_CACHE_DIR,
+            image_cache_max_bytes=Config.IMAGE_CACHE_MAX_BYTES,
+            offline=args.offline or Config.IMAGE_CACHE_OFFLINE,
+            clip_inference_mode=args.inference_mode,
+            clip_num_threads=args.threads,
+            clip_model_name=Config.CLIP_MODEL,
+            clip_model_path=Config.CLIP_MODEL_PATH or None
         )
         
-        if args.source == "json":
-            products = ProductLoader.load_from_json(args.input_file)
-        else:
-            products = ProductLoader.load_from_qdrant(
-                search_engine.qdrant, args.source_collection
-            )
-        
-        if not products:
+        products = load_products(args, search_engine)
+        if products is None:
             logger.error("No products loaded")
             return 1
         
-        products = ProductLoader.filter_products_with_images(products)
-        products = ProductLoader.clean_image_urls(products)
+        products = ProductLoader.iter_products_with_images(products)
         
         search_engine.qdrant.recreate_collection(
             args.collection, 
-            Config.VECTOR_SIZE_IMAGE
+            Config.VECTOR_SIZE_IMAGE,
+            bulk_load=args.bulk_load,
+            quantization=args.quantization,
+            on_disk=args.on_disk
         )
         
-        processed_count = search_engine.build_image_embeddings(
-            products, 
-            args.collection, 
-            args.batch_size
-        )
+        try:
+            processed_count = search_engine.build_image_embeddings(
+                products, 
+                args.collection, 
+                args.batch_size,
+                num_workers=args.workers,
+                threads_per_worker=args.threads or None,
+                worker_start_method=args.worker_start_method
+            )
+        finally:
+            indexed = not args.bulk_load or finish_bulk_load(args, search_engine)
+        
+        if not indexed:
+            return 1
         
         logger.info(f"Successfully processed {processed_count} products")
         return 0
@@ -95,6 +179,16 @@ def build_image_embeddings(args):
         return 1
 
 
+def product_filter(args) -> ProductFilter:
+    return ProductFilter(
+        category=args.category,
+        subcategory=args.subcategory,
+        min_price=args.min_price,
+        max_price=args.max_price,
+        min_rating=args.min_rating
+    )
+
+
 def search_text(args):
     try:
         Config.validate()
@@ -102,7 +196,13 @@ def search_text(args):
         search_engine = VectorSearchEngine(
             qdrant_url=Config.QDRANT_URL,
             qdrant_api_key=Config.QDRANT_API_KEY,
-            openai_api_key=Config.OPENAI_API_KEY
+            qdrant_options=Config.qdrant_options(),
+            openai_api_key=Config.OPENAI_API_KEY,
+            clip_inference_mode=Config.CLIP_INFERENCE_MODE,
+            clip_num_threads=Config.CLIP_NUM_THREADS,
+            clip_towers=Config.CLIP_TOWERS or None,
+            clip_model_name=Config.CLIP_MODEL,
+            clip_model_path=Config.CLIP_MODEL_PATH or None
         )
         
         results = search_engine.search_by_text(
@@ -110,7 +210,14 @@ def search_text(args):
             collection_name=args.collection,
             limit=args.limit,
             score_threshold=args.threshold,
-            use_clip=args.use_clip
+            use_clip=args.use_clip,
+            backend=args.backend,
+            rescore=False if args.no_rescore else None,
+            oversampling=args.oversampling,
+            hnsw_ef=args.hnsw_ef,
+            exact=args.exact,
+            indexed_only=args.indexed_only,
+            filters=product_filter(args)
         )
         
         print(f"\nFound {len(results)} results for '{args.query}':")
@@ -137,14 +244,29 @@ def search_image(args):
         search_engine = VectorSearchEngine(
             qdrant_url=Config.QDRANT_URL,
             qdrant_api_key=Config.QDRANT_API_KEY,
-            openai_api_key=Config.OPENAI_API_KEY
+            qdrant_options=Config.qdrant_options(),
+            openai_api_key=Config.OPENAI_API_KEY,
+            image_cache_dir=Config.IMAGE_CACHE_DIR,
+            image_cache_max_bytes=Config.IMAGE_CACHE_MAX_BYTES,
+            offline=args.offline or Config.IMAGE_CACHE_OFFLINE,
+            clip_inference_mode=Config.CLIP_INFERENCE_MODE,
+            clip_num_threads=Config.CLIP_NUM_THREADS,
+            clip_towers=Config.CLIP_TOWERS or None,
+            clip_model_name=Config.CLIP_MODEL,
+            clip_model_path=Config.CLIP_MODEL_PATH or None
         )
         
         results = search_engine.search_by_image(
             query_image_url=args.query,
             collection_name=args.collection,
             limit=args.limit,
-            score_threshold=args.threshold
+            score_threshold=args.threshold,
+            rescore=False if args.no_rescore else None,
+            oversampling=args.oversampling,
+            hnsw_ef=args.hnsw_ef,
+            exact=args.exact,
+            indexed_only=args.indexed_only,
+            filters=product_filter(args)
         )
         
         print(f"\nFound {len(results)} similar images:")
@@ -170,7 +292,8 @@ def list_collections(args):
         
         search_engine = VectorSearchEngine(
             qdrant_url=Config.QDRANT_URL,
-            qdrant_api_key=Config.QDRANT_API_KEY
+            qdrant_api_key=Config.QDRANT_API_KEY,
+            qdrant_options=Config.qdrant_options()
         )
         
         collections = search_engine.qdrant.get_collections()
@@ -196,7 +319,215 @@ def list_collections(args):
         return 1
 
 
+def index_payload(args):
+    try:
+        Config.validate()
+        
+        qdrant = QdrantManager(Config.QDRANT_URL, Config.QDRANT_API_KEY, **Config.qdrant_options())
+        if not qdrant.create_payload_indexes(args.collection, PAYLOAD_INDEXES):
+            return 1
+        
+        print(f"Indexed {', '.join(PAYLOAD_INDEXES)} in {args.collection}")
+        return 0
+        
+    except Exception as e:
+        logger.error(f"Error indexing payload fields: {e}")
+        return 1
+
+
+def tune_ef(args):
+    try:
+        Config.validate()
+        
+        query_vectors = None
+        if args.queries_file:
+            search_engine = VectorSearchEngine(
+                qdrant_url=Config.QDRANT_URL,
+                qdrant_api_key=Config.QDRANT_API_KEY,
+                qdrant_options=Config.qdrant_options(),
+                openai_api_key=Config.OPENAI_API_KEY,
+                clip_inference_mode=Config.CLIP_INFERENCE_MODE,
+                clip_num_threads=Config.CLIP_NUM_THREADS,
+                clip_towers=Config.CLIP_TOWERS or None,
+                clip_model_name=Config.CLIP_MODEL,
+                clip_model_path=Config.CLIP_MODEL_PATH or None
+            )
+            qdrant = search_engine.qdrant
+            query_vectors = embed_query_file(args.queries_file, args.collection, args.backend, search_engine)
+            if not query_vectors:
+                logger.error(f"No queries embedded from {args.queries_file}")
+                return 1
+        else:
+            qdrant = QdrantManager(Config.QDRANT_URL, Config.QDRANT_API_KEY, **Config.qdrant_options())
+        
+        result = tune_hnsw_ef(
+            qdrant,
+            args.collection,
+            target_recall=args.target_recall,
+            limit=args.limit,
+            sample_size=args.sample_size,
+            candidates=args.ef,
+            store=not args.dry_run,
+            query_vectors=query_vectors
+        )
+        
+        num_queries = len(query_vectors) if query_vectors else args.sample_size
+        source = "queries" if query_vectors else "sampled points"
+        print(f"\nhnsw_ef sweep on {args.collection} (recall@{args.limit}, {num_queries} {source}):")
+        print("-" * 60)
+        print(f"{'hnsw_ef':<10}{'recall':>10}{'ms/query':>12}")
+        for row in result["sweep"]:
+            print(f"{row['hnsw_ef']:<10}{row['recall']:>10.3f}{row['ms_per_query']:>12.2f}")
+        
+        if result["hnsw_ef"] is None:
+            print(f"\nNo hnsw_ef reached recall {args.target_recall}")
+            return 1
+        
+        action = "Chose" if args.dry_run else "Stored"
+        print(f"\n{action} hnsw_ef={result['hnsw_ef']} for {args.collection}")
+        return 0
+        
+    except Exception as e:
+        logger.error(f"Error tuning hnsw_ef: {e}")
+        return 1
+
+
+def embed_query_file(path, collection_name, backend, search_engine):
+    """Embed one query per line; lines starting with http(s):// are image URLs."""
+    with open(path, "r", encoding="utf-8") as f:
+        lines = [line.strip() for line in f if line.strip()]
+    
+    queries = [
+        {"image_url": line} if line.startswith(("http://", "https://")) else {"text": line}
+        for line in lines
+    ]
+    vectors = search_engine.embed_queries(queries, collection_name, backend)
+    return [vector for vector in vectors if vector is not None]
+
+
+def benchmark_clip(args):
+    try:
+        from ..benchmarks.clip_modes import compare_inference_modes
+        from ..core.image_fetcher import ImageFetcher
+        from ..core.image_store import ImageStore
+        
+        products = ProductLoader.load_from_json(args.input_file)
+        products = ProductLoader.filter_products_with_images(products)
+        products = ProductLoader.clean_image_urls(products)[:args.sample_size]
+        
+        if not products:
+            logger.error("No products with images loaded")
+            return 1
+        
+        fetcher = ImageFetcher(
+            store=(
+                ImageStore(Config.IMAGE_CACHE_DIR, Config.IMAGE_CACHE_MAX_BYTES)
+                if Config.IMAGE_CACHE_DIR else None
+            ),
+            offline=Config.IMAGE_CACHE_OFFLINE
+        )
+        images = [
+            image for image in fetcher.fetch_many(p['main_image_url'] for p in products)
+            if image is not None
+        ]
+        fetcher.close()
+        
+        if not images:
+            logger.error("No sample images could be loaded")
+            return 1
+        
+        report = compare_inference_modes(
+            images,
+            modes=args.modes,
+            model_name=Config.CLIP_MODEL,
+            batch_size=args.batch_size,
+            num_threads=args.threads,
+            model_path=Config.CLIP_MODEL_PATH or None
+        )
+        
+        print(f"\nCLIP inference modes on {len(images)} images:")
+        print("-" * 60)
+        print(f"{'mode':<8}{'images/sec':>12}{'mean cos':>12}{'min cos':>12}")
+        for row in report:
+            print(f"{row['mode']:<8}{row['images_per_sec']:>12.1f}"
+                  f"{row['mean_cosine']:>12.5f}{row['min_cosine']:>12.5f}")
+        
+        return 0
+        
+    except Exception as e:
+        logger.error(f"Error benchmarking CLIP inference modes: {e}")
+        return 1
+
+
+def benchmark_transport(args):
+    try:
+        Config.validate()
+        
+        from ..benchmarks.transport import compare_transports
+        
+        report = compare_transports(
+            Config.QDRANT_URL,
+            Config.QDRANT_API_KEY,
+            transports=args.transports,
+            vector_size=args.vector_size,
+            num_points=args.num_points,
+            batch_size=args.batch_size,
+            num_queries=args.queries,
+            grpc_port=Config.QDRANT_GRPC_PORT
+        )
+        
+        print(f"\nQdrant transports at {Config.QDRANT_URL} ({args.num_points} points, {args.queries} searches):")
+        print("-" * 60)
+        print(f"{'transport':<10}{'points/sec':>12}{'p50 ms':>12}{'p95 ms':>12}")
+        for row in report:
+            print(f"{row['transport']:<10}{row['points_per_sec']:>12.0f}"
+                  f"{row['p50_ms']:>12.2f}{row['p95_ms']:>12.2f}")
+        
+        return 0
+        
+    except Exception as e:
+        logger.error(f"Error benchmarking Qdrant transports: {e}")
+        return 1
+
+
+def benchmark_quantization(args):
+    try:
+        Config.validate()
+        
+        from ..benchmarks.quantization import compare_quantization
+        
+        report = compare_quantization(
+            Config.QDRANT_URL,
+            Config.QDRANT_API_KEY,
+            qdrant_options=Config.qdrant_options(),
+            modes=args.modes,
+            source_collection=args.source_collection,
+            vector_size=args.vector_size,
+            num_points=args.num_points,
+            num_queries=args.queries,
+            limit=args.limit,
+            rescore=not args.no_rescore,
+            oversampling=args.oversampling,
+            on_disk=not args.in_memory
+        )
+        
+        print(f"\nQuantization at {Config.QDRANT_URL} ({args.num_points} points, recall@{args.limit}):")
+        print("-" * 60)
+        print(f"{'mode':<10}{'recall':>10}{'p50 ms':>10}{'p95 ms':>10}{'RAM MB':>12}")
+        for row in report:
+            print(f"{row['mode']:<10}{row['recall']:>10.3f}{row['p50_ms']:>10.2f}"
+                  f"{row['p95_ms']:>10.2f}{row['vector_ram_mb']:>12.1f}")
+        
+        return 0
+        
+    except Exception as e:
+        logger.error(f"Error benchmarking quantization: {e}")
+        return 1
+
+
 def main():
+    Config.load()
+    
     parser = argparse.ArgumentParser(
         description="Vector Search Engine for IKEA Products",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -216,6 +547,21 @@ Examples:
 
   # List collections
   python -m vector_search.cli list-collections
+
+  # Compare CLIP inference modes
+  python -m vector_search.cli benchmark-clip --input-file products.json
+
+  # Filtered search
+  python -m vector_search.cli search-text --query "sofa" --category Sofas --max-price 500
+  
+  # Pick the search ef for a collection
+  python -m vector_search.cli tune-ef --collection furniture_images --queries-file queries.txt
+  
+  # Compare Qdrant REST and gRPC
+  python -m vector_search.cli benchmark-transport
+  
+  # Recall and latency of quantized collections
+  python -m vector_search.cli benchmark-quantization --source-collection furniture_images
         """
     )
     
@@ -228,10 +574,24 @@ Examples:
     build_text_parser.add_argument("--input-file", help="Input JSON file (for json source)")
     build_text_parser.add_argument("--source-collection", default="ikea_products",
                                  help="Source collection (for qdrant source)")
+    build_text_parser.add_argument("--scroll-workers", type=int, default=4,
+                                 help="Parallel readers for a qdrant source")
     build_text_parser.add_argument("--collection", default="ikea_products",
                                  help="Target collection name")
     build_text_parser.add_argument("--batch-size", type=int, default=Config.BATCH_SIZE,
                                  help="Batch size for processing")
+    build_text_parser.add_argument("--backend", choices=["openai", "clip"], default="openai",
+                                 help="Text embedding backend (clip runs locally)")
+    build_text_parser.add_argument("--concurrent", action="store_true",
+                                 help="Send embedding requests concurrently within the OpenAI rate limits")
+    build_text_parser.add_argument("--bulk-load", action="store_true",
+                                 help="Defer indexing until all points are ingested")
+    build_text_parser.add_argument("--index-timeout", type=float, default=Config.INDEX_TIMEOUT,
+                                 help="Seconds to wait for indexing after --bulk-load")
+    build_text_parser.add_argument("--quantization", choices=["scalar", "product", "binary"],
+                                 help="Quantize vectors in the collection (kept in RAM)")
+    build_text_parser.add_argument("--on-disk", action="store_true",
+                                 help="Store original vectors on disk")
     
     # Build image embeddings command
     build_image_parser = subparsers.add_parser("build-image", help="Build image embeddings")
@@ -240,10 +600,32 @@ Examples:
     build_image_parser.add_argument("--input-file", help="Input JSON file (for json source)")
     build_image_parser.add_argument("--source-collection", default="ikea_products",
                                   help="Source collection (for qdrant source)")
+    build_image_parser.add_argument("--scroll-workers", type=int, default=4,
+                                  help="Parallel readers for a qdrant source")
     build_image_parser.add_argument("--collection", default="furniture_images",
                                   help="Target collection name")
     build_image_parser.add_argument("--batch-size", type=int, default=Config.BATCH_SIZE,
                                   help="Batch size for processing")
+    build_image_parser.add_argument("--offline", action="store_true",
+                                  help="Only use images from the local image cache")
+    build_image_parser.add_argument("--inference-mode", choices=["fp32", "int8", "bf16"],
+                                  default=Config.CLIP_INFERENCE_MODE,
+                                  help="CLIP inference precision")
+    build_image_parser.add_argument("--threads", type=int, default=Config.CLIP_NUM_THREADS,
+                                  help="Intra-op threads for CLIP inference (0 = torch default)")
+    build_image_parser.add_argument("--workers", type=int, default=Config.CLIP_NUM_WORKERS,
+                                  help="CLIP worker processes (0 = embed in-process)")
+    build_image_parser.add_argument("--worker-start-method", choices=["forkserver", "spawn", "fork"],
+                                  default=Config.CLIP_WORKER_START_METHOD or None,
+                                  help="How CLIP workers start (default: forkserver, or spawn)")
+    build_image_parser.add_argument("--bulk-load", action="store_true",
+                                  help="Defer indexing until all points are ingested")
+    build_image_parser.add_argument("--index-timeout", type=float, default=Config.INDEX_TIMEOUT,
+                                  help="Seconds to wait for indexing after --bulk-load")
+    build_image_parser.add_argument("--quantization", choices=["scalar", "product", "binary"],
+                                  help="Quantize vectors in the collection (kept in RAM)")
+    build_image_parser.add_argument("--on-disk", action="store_true",
+                                  help="Store original vectors on disk")
     
     # Search text command
     search_text_parser = subparsers.add_parser("search-text", help="Search by text")
@@ -256,6 +638,25 @@ Examples:
                                   help="Similarity threshold")
     search_text_parser.add_argument("--use-clip", action="store_true",
                                   help="Use CLIP instead of OpenAI for text search")
+    search_text_parser.add_argument("--backend", choices=["openai", "clip"], default=None,
+                                  help="Text embedding backend (default: the one the collection was built with)")
+    search_text_parser.add_argument("--oversampling", type=float, default=None,
+                                  help="Candidates to fetch per result on quantized collections")
+    search_text_parser.add_argument("--no-rescore", action="store_true",
+                                  help="Rank by quantized scores only, without rescoring")
+    search_text_parser.add_argument("--hnsw-ef", type=int, default=None,
+                                  help="HNSW search ef (default: the tuned value, see tune-ef)")
+    search_text_parser.add_argument("--exact", action="store_true",
+                                  help="Exact search without the HNSW index")
+    search_text_parser.add_argument("--indexed-only", action="store_true",
+                                  help="Skip segments that are not indexed yet")
+    search_text_parser.add_argument("--category", nargs="+", default=None,
+                                  help="Only products in one of these categories")
+    search_text_parser.add_argument("--subcategory", nargs="+", default=None,
+                                  help="Only products in one of these subcategories")
+    search_text_parser.add_argument("--min-price", type=float, default=None, help="Minimum price")
+    search_text_parser.add_argument("--max-price", type=float, default=None, help="Maximum price")
+    search_text_parser.add_argument("--min-rating", type=float, default=None, help="Minimum rating (0-5)")
     
     # Search image command
     search_image_parser = subparsers.add_parser("search-image", help="Search by image")
@@ -266,10 +667,104 @@ Examples:
                                    help="Number of results")
     search_image_parser.add_argument("--threshold", type=float, default=Config.DEFAULT_THRESHOLD,
                                    help="Similarity threshold")
+    search_image_parser.add_argument("--offline", action="store_true",
+                                   help="Only use images from the local image cache")
+    search_image_parser.add_argument("--oversampling", type=float, default=None,
+                                   help="Candidates to fetch per result on quantized collections")
+    search_image_parser.add_argument("--no-rescore", action="store_true",
+                                   help="Rank by quantized scores only, without rescoring")
+    search_image_parser.add_argument("--hnsw-ef", type=int, default=None,
+                                   help="HNSW search ef (default: the tuned value, see tune-ef)")
+    search_image_parser.add_argument("--exact", action="store_true",
+                                   help="Exact search without the HNSW index")
+    search_image_parser.add_argument("--indexed-only", action="store_true",
+                                   help="Skip segments that are not indexed yet")
+    search_image_parser.add_argument("--category", nargs="+", default=None,
+                                   help="Only products in one of these categories")
+    search_image_parser.add_argument("--subcategory", nargs="+", default=None,
+                                   help="Only products in one of these subcategories")
+    search_image_parser.add_argument("--min-price", type=float, default=None, help="Minimum price")
+    search_image_parser.add_argument("--max-price", type=float, default=None, help="Maximum price")
+    search_image_parser.add_argument("--min-rating", type=float, default=None, help="Minimum rating (0-5)")
     
     # List collections command
     subparsers.add_parser("list-collections", help="List available collections")
     
+    # Index payload fields command
+    index_payload_parser = subparsers.add_parser("index-payload",
+                                               help="Index the catalog fields used by search filters")
+    index_payload_parser.add_argument("--collection", required=True, help="Collection to index")
+    
+    # Tune hnsw_ef command
+    tune_ef_parser = subparsers.add_parser("tune-ef", help="Store the smallest hnsw_ef that meets a target recall")
+    tune_ef_parser.add_argument("--collection", required=True, help="Collection to tune")
+    tune_ef_parser.add_argument("--target-recall", type=float, default=0.95,
+                              help="Recall to reach against exact search")
+    tune_ef_parser.add_argument("--limit", type=int, default=Config.DEFAULT_LIMIT,
+                              help="Results per search (recall is measured at this depth)")
+    tune_ef_parser.add_argument("--queries-file",
+                              help="Representative queries, one per line (text, or an image URL)")
+    tune_ef_parser.add_argument("--backend", choices=["openai", "clip"], default=None,
+                              help="Text embedding backend for --queries-file (default: the collection's)")
+    tune_ef_parser.add_argument("--sample-size", type=int, default=100,
+                              help="Collection points used as queries without --queries-file")
+    tune_ef_parser.add_argument("--ef", type=int, nargs="+", default=list(EF_CANDIDATES),
+                              help="hnsw_ef values to try")
+    tune_ef_parser.add_argument("--dry-run", action="store_true",
+                              help="Report the sweep without storing the result")
+    
+    # Benchmark CLIP inference modes command
+    benchmark_clip_parser = subparsers.add_parser("benchmark-clip",
+                                                help="Compare CLIP inference modes against fp32")
+    benchmark_clip_parser.add_argument("--input-file", required=True, help="Input JSON file")
+    benchmark_clip_parser.add_argument("--sample-size", type=int, default=64,
+                                     help="Number of product images to embed")
+    benchmark_clip_parser.add_argument("--modes", nargs="+", choices=["fp32", "int8", "bf16"],
+                                     default=["fp32", "int8", "bf16"],
+                                     help="Inference modes to compare")
+    benchmark_clip_parser.add_argument("--batch-size", type=int, default=16,
+                                     help="Images per forward pass")
+    benchmark_clip_parser.add_argument("--threads", type=int, default=Config.CLIP_NUM_THREADS,
+                                     help="Intra-op threads for CLIP inference (0 = torch default)")
+    
+    # Benchmark Qdrant transports command
+    benchmark_transport_parser = subparsers.add_parser("benchmark-transport",
+                                                     help="Compare Qdrant REST and gRPC latency and throughput")
+    benchmark_transport_parser.add_argument("--transports", nargs="+", choices=["rest", "grpc"],
+                                          default=["rest", "grpc"],
+                                          help="Transports to compare")
+    benchmark_transport_parser.add_argument("--vector-size", type=int, default=Config.VECTOR_SIZE_IMAGE,
+                                          help="Dimension of the random test vectors")
+    benchmark_transport_parser.add_argument("--num-points", type=int, default=5000,
+                                          help="Points to upsert")
+    benchmark_transport_parser.add_argument("--batch-size", type=int, default=256,
+                                          help="Points per upsert request")
+    benchmark_transport_parser.add_argument("--queries", type=int, default=200,
+                                          help="Searches to time")
+    
+    # Benchmark quantization command
+    benchmark_quantization_parser = subparsers.add_parser("benchmark-quantization",
+                                                        help="Compare recall and latency of quantized collections")
+    benchmark_quantization_parser.add_argument("--modes", nargs="+", choices=["none", "scalar", "product", "binary"],
+                                             default=["none", "scalar", "product", "binary"],
+                                             help="Quantization modes to compare (none = unquantized baseline)")
+    benchmark_quantization_parser.add_argument("--source-collection", default=None,
+                                             help="Take vectors from this collection instead of random ones")
+    benchmark_quantization_parser.add_argument("--vector-size", type=int, default=Config.VECTOR_SIZE_IMAGE,
+                                             help="Dimension of the random test vectors")
+    benchmark_quantization_parser.add_argument("--num-points", type=int, default=20000,
+                                             help="Points to index")
+    benchmark_quantization_parser.add_argument("--queries", type=int, default=200,
+                                             help="Searches to time")
+    benchmark_quantization_parser.add_argument("--limit", type=int, default=10,
+                                             help="Results per search (recall is measured at this depth)")
+    benchmark_quantization_parser.add_argument("--oversampling", type=float, default=2.0,
+                                             help="Candidates to fetch per result on quantized collections")
+    benchmark_quantization_parser.add_argument("--no-rescore", action="store_true",
+                                             help="Rank by quantized scores only, without rescoring")
+    benchmark_quantization_parser.add_argument("--in-memory", action="store_true",
+                                             help="Keep original vectors in RAM alongside the quantized ones")
+    
     args = parser.parse_args()
     
     if not args.command:
@@ -286,6 +781,16 @@ Examples:
         return search_image(args)
     elif args.command == "list-collections":
         return list_collections(args)
+    elif args.command == "benchmark-clip":
+        return benchmark_clip(args)
+    elif args.command == "index-payload":
+        return index_payload(args)
+    elif args.command == "tune-ef":
+        return tune_ef(args)
+    elif args.command == "benchmark-transport":
+        return benchmark_transport(args)
+    elif args.command == "benchmark-quantization":
+        return benchmark_quantization(args)
     else:
         parser.print_help()
         return 1
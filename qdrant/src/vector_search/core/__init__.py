@@ -1,7 +1,64 @@
 """Core search engine modules."""
 
-from .search_engine import VectorSearchEngine
-from .embedders import CLIPEmbedder, OpenAIEmbedder
-from .qdrant_client import QdrantManager
+import importlib
+from typing import TYPE_CHECKING
 
-__all__ = ["VectorSearchEngine", "CLIPEmbedder", "OpenAIEmbedder", "QdrantManager"]
+if TYPE_CHECKING:
+    from .search_engine import VectorSearchEngine
+    from .async_search_engine import AsyncVectorSearchEngine
+    from .embedders import AsyncOpenAIEmbedder, CLIPEmbedder, OpenAIEmbedder
+    from .qdrant_client import QdrantManager
+    from .async_qdrant_client import AsyncQdrantManager
+    from .bulk_upload import BulkUploader
+    from .filters import ProductFilter
+    from .image_fetcher import ImageFetcher
+    from .image_store import ImageStore
+    from .embedding_cache import EmbeddingCache
+    from .query_cache import QueryEmbeddingCache
+    from .embedding_pool import CLIPEmbeddingPool
+
+__all__ = [
+    "VectorSearchEngine",
+    "AsyncVectorSearchEngine",
+    "CLIPEmbedder",
+    "OpenAIEmbedder",
+    "AsyncOpenAIEmbedder",
+    "QdrantManager",
+    "AsyncQdrantManager",
+    "BulkUploader",
+    "ProductFilter",
+    "ImageFetcher",
+    "ImageStore",
+    "EmbeddingCache",
+    "QueryEmbeddingCache",
+    "CLIPEmbeddingPool"
+]
+
+_EXPORTS = {
+    "VectorSearchEngine": ".search_engine",
+    "AsyncVectorSearchEngine": ".async_search_engine",
+    "CLIPEmbedder": ".embedders",
+    "OpenAIEmbedder": ".embedders",
+    "AsyncOpenAIEmbedder": ".embedders",
+    "QdrantManager": ".qdrant_client",
+    "AsyncQdrantManager": ".async_qdrant_client",
+    "BulkUploader": ".bulk_upload",
+    "ProductFilter": ".filters",
+    "ImageFetcher": ".image_fetcher",
+    "ImageStore": ".image_store",
+    "EmbeddingCache": ".embedding_cache",
+    "QueryEmbeddingCache": ".query_cache",
+    "CLIPEmbeddingPool": ".embedding_pool",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
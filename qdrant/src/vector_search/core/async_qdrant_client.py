@@ -0,0 +1,137 @@
+"""Asyncio Qdrant client wrapper for searches and point writes."""
+
+import logging
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Batch, CollectionInfo
+
+from .qdrant_client import (
+    METADATA_COLLECTION, client_options, format_results, is_not_found, metadata_from_points,
+    metadata_point_id, search_params, search_request
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncQdrantManager:
+    """Awaitable counterpart of ``QdrantManager`` for serving paths.
+
+    Takes the same connection settings. Covers lookups, searches and
+    upserts; collection management stays on the synchronous manager.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        api_key: Optional[str] = None,
+        prefer_grpc: bool = False,
+        grpc_port: int = 6334,
+        timeout: Optional[int] = None,
+        http2: bool = False,
+        pool_size: Optional[int] = None
+    ):
+        self.url = url
+        self.api_key = api_key
+        self.prefer_grpc = prefer_grpc
+
+        self.client = AsyncQdrantClient(**client_options(
+            url, api_key, prefer_grpc, grpc_port, timeout, http2, pool_size
+        ))
+
+        logger.info(f"Connected to Qdrant at {url} ({'gRPC' if prefer_grpc else 'REST'}, async)")
+
+    async def get_collections(self) -> List[str]:
+        try:
+            collections = await self.client.get_collections()
+            return [col.name for col in collections.collections if col.name != METADATA_COLLECTION]
+        except Exception as e:
+            logger.error(f"Failed to get collections: {e}")
+            return []
+
+    async def collection_exists(self, collection_name: str) -> bool:
+        return collection_name in await self.get_collections()
+
+    async def get_collection_info(self, collection_name: str) -> Optional[CollectionInfo]:
+        try:
+            return await self.client.get_collection(collection_name)
+        except Exception as e:
+            logger.error(f"Failed to get collection info for {collection_name}: {e}")
+            return None
+
+    async def get_collection_metadata(self, collection_name: str) -> Dict[str, Any]:
+        try:
+            points = await self.client.retrieve(
+                METADATA_COLLECTION, ids=[metadata_point_id(collection_name)], with_payload=True
+            )
+            return metadata_from_points(points)
+        except Exception as e:
+            if not is_not_found(e):
+                logger.error(f"Failed to get metadata for {collection_name}: {e}")
+            return {}
+
+    async def upsert_vectors(
+        self,
+        collection_name: str,
+        ids: List[Union[str, int]],
+        vectors: np.ndarray,
+        payloads: List[Dict[str, Any]],
+        wait: bool = True
+    ) -> bool:
+        try:
+            await self.client.upsert(
+                collection_name=collection_name,
+                points=Batch(
+                    ids=ids,
+                    vectors=np.ascontiguousarray(vectors, dtype=np.float32).tolist(),
+                    payloads=payloads
+                ),
+                wait=wait
+            )
+            logger.info(f"Upserted {len(ids)} points to {collection_name}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to upsert points to {collection_name}: {e}")
+            return False
+
+    async def search(
+        self,
+        collection_name: str,
+        query_vector: Union[np.ndarray, List[float]],
+        limit: int = 10,
+        score_threshold: Optional[float] = None,
+        filter_conditions: Optional[Dict] = None,
+        rescore: Optional[bool] = None,
+        oversampling: Optional[float] = None,
+        hnsw_ef: Optional[int] = None,
+        exact: bool = False,
+        indexed_only: bool = False
+    ) -> List[Dict[str, Any]]:
+        try:
+            results = await self.client.search(**search_params(
+                collection_name, query_vector, limit, score_threshold, filter_conditions,
+                rescore, oversampling, hnsw_ef, exact, indexed_only
+            ))
+            return format_results(results)
+        except Exception as e:
+            logger.error(f"Search failed in {collection_name}: {e}")
+            return []
+
+    async def search_batch(
+        self,
+        collection_name: str,
+        requests: List[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        try:
+            batch_results = await self.client.search_batch(
+                collection_name=collection_name,
+                requests=[search_request(request) for request in requests]
+            )
+            return [format_results(results) for results in batch_results]
+        except Exception as e:
+            logger.error(f"Batch search failed in {collection_name}: {e}")
+            return [[] for _ in requests]
+
+    async def close(self) -> None:
+        await self.client.close()
@@ -0,0 +1,190 @@
+"""Asyncio front end to the vector search engine."""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from .async_qdrant_client import AsyncQdrantManager
+from .filters import ProductFilter, as_filter
+from .search_engine import VectorSearchEngine
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncVectorSearchEngine:
+    """Awaitable searches and builds on top of ``VectorSearchEngine``.
+
+    Qdrant calls go through an ``AsyncQdrantManager`` and never block the
+    event loop. Embedding is CPU-bound (or a blocking API call) and runs on a
+    pool of ``embedding_workers`` threads, so concurrent requests embed and
+    search in parallel without a thread per request. Builds are long-running
+    and run on the loop's default executor.
+
+    Other keyword arguments are passed to ``VectorSearchEngine``, whose
+    embedders and caches are shared with the synchronous ``engine``.
+    """
+
+    def __init__(
+        self,
+        qdrant_url: str,
+        qdrant_api_key: Optional[str] = None,
+        qdrant_options: Optional[Dict[str, Any]] = None,
+        embedding_workers: int = 4,
+        **engine_options
+    ):
+        self.engine = VectorSearchEngine(
+            qdrant_url, qdrant_api_key, qdrant_options=qdrant_options, **engine_options
+        )
+        self.qdrant = AsyncQdrantManager(qdrant_url, qdrant_api_key, **(qdrant_options or {}))
+        self._executor = ThreadPoolExecutor(
+            max_workers=embedding_workers, thread_name_prefix="embedding"
+        )
+
+    async def warmup(self, clip: bool = True, openai: bool = True) -> None:
+        await self._run(self.engine.warmup, clip, openai)
+
+    async def collection_metadata(self, collection_name: str) -> Dict[str, Any]:
+        # Fills the engine's metadata cache, so its embedding helpers don't
+        # look the collection up with blocking calls; search options take the
+        # returned metadata, as the cache may expire in between
+        metadata = self.engine.cached_collection_metadata(collection_name)
+        if metadata is None:
+            metadata = await self.qdrant.get_collection_metadata(collection_name)
+            self.engine.cache_collection_metadata(collection_name, metadata)
+        return metadata
+
+    def invalidate_collection_metadata(self, collection_name: Optional[str] = None) -> None:
+        self.engine.invalidate_collection_metadata(collection_name)
+    
+    async def collection_backend(self, collection_name: str) -> Optional[str]:
+        return (await self.collection_metadata(collection_name)).get("embedding_backend")
+
+    async def search_by_text(
+        self,
+        query_text: str,
+        collection_name: str,
+        limit: int = 10,
+        score_threshold: float = 0.7,
+        use_clip: bool = False,
+        backend: Optional[str] = None,
+        rescore: Optional[bool] = None,
+        oversampling: Optional[float] = None,
+        hnsw_ef: Optional[int] = None,
+        exact: bool = False,
+        indexed_only: bool = False,
+        filters: Optional[ProductFilter] = None
+    ) -> List[Dict[str, Any]]:
+        metadata = await self.collection_metadata(collection_name)
+        query_embedding = await self._run(
+            self.engine.embed_text_query, query_text, collection_name,
+            "clip" if use_clip else backend
+        )
+
+        if query_embedding is None:
+            logger.error("Failed to generate query embedding")
+            return []
+
+        results = await self.qdrant.search(
+            collection_name=collection_name,
+            query_vector=query_embedding,
+            limit=limit,
+            score_threshold=score_threshold,
+            filter_conditions=as_filter(filters),
+            **self.engine.search_options(
+                collection_name, rescore, oversampling, hnsw_ef, exact, indexed_only, metadata
+            )
+        )
+
+        return self.engine.format_search_results(results)
+
+    async def search_by_image(
+        self,
+        query_image_url: str,
+        collection_name: str,
+        limit: int = 10,
+        score_threshold: float = 0.7,
+        rescore: Optional[bool] = None,
+        oversampling: Optional[float] = None,
+        hnsw_ef: Optional[int] = None,
+        exact: bool = False,
+        indexed_only: bool = False,
+        filters: Optional[ProductFilter] = None
+    ) -> List[Dict[str, Any]]:
+        metadata = await self.collection_metadata(collection_name)
+        query_embedding = await self._run(
+            self.engine.embed_image_query, query_image_url, collection_name
+        )
+
+        if query_embedding is None:
+            logger.error("Failed to generate query embedding")
+            return []
+
+        results = await self.qdrant.search(
+            collection_name=collection_name,
+            query_vector=query_embedding,
+            limit=limit,
+            score_threshold=score_threshold,
+            filter_conditions=as_filter(filters),
+            **self.engine.search_options(
+                collection_name, rescore, oversampling, hnsw_ef, exact, indexed_only, metadata
+            )
+        )
+
+        return self.engine.format_search_results(results)
+
+    async def search_many(
+        self,
+        queries: List[Dict[str, Any]],
+        collection_name: str,
+        limit: int = 10,
+        score_threshold: float = 0.7,
+        backend: Optional[str] = None,
+        rescore: Optional[bool] = None,
+        oversampling: Optional[float] = None,
+        hnsw_ef: Optional[int] = None,
+        exact: bool = False,
+        indexed_only: bool = False
+    ) -> List[List[Dict[str, Any]]]:
+        metadata = await self.collection_metadata(collection_name)
+        vectors = await self._run(self.engine.embed_queries, queries, collection_name, backend)
+        positions, requests = self.engine.batch_search_requests(
+            queries, vectors, limit, score_threshold,
+            self.engine.search_options(
+                collection_name, rescore, oversampling, hnsw_ef, exact, indexed_only, metadata
+            )
+        )
+
+        results: List[List[Dict[str, Any]]] = [[] for _ in queries]
+        if requests:
+            batch_results = await self.qdrant.search_batch(collection_name, requests)
+            for i, hits in zip(positions, batch_results):
+                results[i] = self.engine.format_search_results(hits)
+        return results
+
+    async def build_text_embeddings(self, *args, **kwargs) -> int:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.engine.build_text_embeddings, *args, **kwargs)
+        )
+
+    async def build_image_embeddings(self, *args, **kwargs) -> int:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.engine.build_image_embeddings, *args, **kwargs)
+        )
+
+    async def close(self) -> None:
+        await self.qdrant.close()
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> "AsyncVectorSearchEngine":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _run(self, func: Callable, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
@@ -0,0 +1,140 @@
+"""Pipelined bulk upserts into Qdrant."""
+
+import json
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.models import Batch
+
+logger = logging.getLogger(__name__)
+
+# Rough size of one float in a JSON request body
+JSON_BYTES_PER_FLOAT = 12
+
+
+class BulkUploader:
+    """Buffers points and upserts them in the background.
+
+    Batches are cut when their estimated request size reaches
+    ``batch_bytes`` (or ``max_batch_points``), so large payloads make smaller
+    batches. Up to ``parallel`` batches are sent concurrently and the caller
+    goes back to embedding while they are in flight; ``add`` only blocks
+    when ``max_in_flight`` batches are already queued.
+
+    Every batch is sent with ``wait=True``, so it only counts as uploaded
+    once each shard it touches has applied it. ``flush`` sends what is
+    buffered and waits for every in-flight batch; when it returns True all
+    points are applied and searchable, on sharded collections too.
+    """
+
+    def __init__(
+        self,
+        client: QdrantClient,
+        collection_name: str,
+        parallel: int = 4,
+        batch_bytes: int = 4 * 1024 ** 2,
+        max_batch_points: int = 1024,
+        max_in_flight: Optional[int] = None
+    ):
+        self.client = client
+        self.collection_name = collection_name
+        self.batch_bytes = batch_bytes
+        self.max_batch_points = max_batch_points
+
+        self.uploaded = 0
+        self.failed = 0
+
+        self._executor = ThreadPoolExecutor(max_workers=parallel, thread_name_prefix="qdrant-upsert")
+        self._slots = threading.BoundedSemaphore(max_in_flight or 2 * parallel)
+        self._inflight: List[Future] = []
+        self._lock = threading.Lock()
+
+        self._ids: List[Union[str, int]] = []
+        self._vectors: List[np.ndarray] = []
+        self._payloads: List[Dict[str, Any]] = []
+        self._buffered_bytes = 0
+
+    def add(
+        self,
+        ids: List[Union[str, int]],
+        vectors: np.ndarray,
+        payloads: List[Dict[str, Any]]
+    ) -> None:
+        vector_bytes = vectors.shape[1] * JSON_BYTES_PER_FLOAT if len(vectors) else 0
+
+        for i, payload in enumerate(payloads):
+            self._ids.append(ids[i])
+            self._vectors.append(vectors[i])
+            self._payloads.append(payload)
+            self._buffered_bytes += vector_bytes + len(json.dumps(payload, default=str))
+
+            if self._buffered_bytes >= self.batch_bytes or len(self._ids) >= self.max_batch_points:
+                self._submit(*self._take_buffer())
+
+    def flush(self) -> bool:
+        """Send buffered points and wait until all writes are applied.
+
+        Returns False if any batch failed; failures are logged and counted in
+        ``failed``.
+        """
+        if self._ids:
+            self._submit(*self._take_buffer())
+        self._wait_inflight()
+
+        logger.info(
+            f"Bulk upload to {self.collection_name} done: "
+            f"{self.uploaded} points written, {self.failed} failed"
+        )
+        return self.failed == 0
+
+    def close(self) -> None:
+        self.flush()
+        self._executor.shutdown()
+
+    def __enter__(self) -> "BulkUploader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _take_buffer(self) -> Tuple[List, np.ndarray, List]:
+        batch = (self._ids, np.stack(self._vectors), self._payloads)
+        self._ids, self._vectors, self._payloads = [], [], []
+        self._buffered_bytes = 0
+        return batch
+
+    def _submit(self, ids: List, vectors: np.ndarray, payloads: List) -> None:
+        self._slots.acquire()
+        future = self._executor.submit(self._upsert, ids, vectors, payloads)
+        future.add_done_callback(lambda _: self._slots.release())
+        with self._lock:
+            self._inflight = [f for f in self._inflight if not f.done()]
+            self._inflight.append(future)
+
+    def _wait_inflight(self) -> None:
+        with self._lock:
+            inflight, self._inflight = self._inflight, []
+        for future in inflight:
+            future.result()
+
+    def _upsert(self, ids: List, vectors: np.ndarray, payloads: List) -> None:
+        try:
+            self.client.upsert(
+                collection_name=self.collection_name,
+                points=Batch(
+                    ids=ids,
+                    vectors=np.ascontiguousarray(vectors, dtype=np.float32).tolist(),
+                    payloads=payloads
+                ),
+                wait=True
+            )
+            with self._lock:
+                self.uploaded += len(ids)
+        except Exception as e:
+            logger.error(f"Failed to upsert {len(ids)} points to {self.collection_name}: {e}")
+            with self._lock:
+                self.failed += len(ids)
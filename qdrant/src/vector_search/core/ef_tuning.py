@@ -0,0 +1,119 @@
+"""Choosing the HNSW search ef for a collection from measured recall."""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .qdrant_client import QdrantManager
+
+logger = logging.getLogger(__name__)
+
+EF_CANDIDATES = (16, 24, 32, 48, 64, 96, 128, 192, 256, 384, 512)
+
+
+def tune_hnsw_ef(
+    qdrant: QdrantManager,
+    collection_name: str,
+    target_recall: float = 0.95,
+    limit: int = 10,
+    sample_size: int = 100,
+    candidates: Sequence[int] = EF_CANDIDATES,
+    store: bool = True,
+    query_vectors: Optional[Sequence[Union[np.ndarray, List[float]]]] = None
+) -> Dict[str, Any]:
+    """Find the smallest ``hnsw_ef`` whose recall@``limit`` meets ``target_recall``.
+
+    ``query_vectors`` should be real queries embedded the way searches embed
+    them (see ``VectorSearchEngine.embed_queries``), since the stored ef
+    becomes the default for every search. Without them, vectors of
+    ``sample_size`` points from the collection stand in; each of those is
+    its own nearest neighbour, so it is dropped from both result lists and
+    recall is measured on the ``limit`` results after it.
+
+    Ground truth is an exact search; each candidate ef (those below
+    ``limit`` are skipped) runs the same queries as one batch. With
+    ``store`` the chosen ef is saved in the collection metadata, where
+    ``VectorSearchEngine`` searches pick it up as their default.
+
+    Returns the chosen ``hnsw_ef`` (None if no candidate reached the
+    target) and the sweep, one row per ef with recall and mean latency.
+    """
+    if query_vectors is not None:
+        queries = list(query_vectors)
+        own_ids: List[Any] = [None] * len(queries)
+        depth = limit
+    else:
+        own_ids, queries = _sample_points(qdrant, collection_name, sample_size)
+        # One extra result makes up for the query point itself
+        depth = limit + 1
+    if not queries:
+        raise ValueError(f"No queries to tune {collection_name} with")
+
+    exact = qdrant.search_batch(collection_name, [
+        {"query_vector": vector, "limit": depth, "exact": True} for vector in queries
+    ])
+    truth = [set(_neighbour_ids(hits, own_id, limit)) for hits, own_id in zip(exact, own_ids)]
+    expected = sum(len(ids) for ids in truth)
+
+    sweep: List[Dict[str, Any]] = []
+    chosen: Optional[int] = None
+    for ef in sorted(ef for ef in candidates if ef >= limit):
+        start = time.perf_counter()
+        batch_results = qdrant.search_batch(collection_name, [
+            {"query_vector": vector, "limit": depth, "hnsw_ef": ef} for vector in queries
+        ])
+        elapsed = time.perf_counter() - start
+
+        found = sum(
+            len(ids.intersection(_neighbour_ids(hits, own_id, limit)))
+            for ids, hits, own_id in zip(truth, batch_results, own_ids)
+        )
+        recall = found / expected if expected else 1.0
+        sweep.append({"hnsw_ef": ef, "recall": recall, "ms_per_query": elapsed * 1000 / len(queries)})
+        logger.info(f"hnsw_ef={ef}: recall@{limit} {recall:.3f}")
+
+        if recall >= target_recall:
+            chosen = ef
+            break
+
+    if chosen is None:
+        logger.warning(
+            f"No hnsw_ef up to {sweep[-1]['hnsw_ef'] if sweep else None} reached "
+            f"recall {target_recall} on {collection_name}"
+        )
+    elif store:
+        qdrant.set_collection_metadata(collection_name, {
+            "hnsw_ef": chosen,
+            "hnsw_ef_recall": sweep[-1]["recall"],
+            "hnsw_ef_target_recall": target_recall,
+            "hnsw_ef_limit": limit,
+            "hnsw_ef_queries": "collection sample" if query_vectors is None else "queries"
+        })
+        logger.info(f"Stored hnsw_ef={chosen} for {collection_name}")
+
+    return {"hnsw_ef": chosen, "sweep": sweep}
+
+
+def _neighbour_ids(hits: List[Dict[str, Any]], own_id: Any, limit: int) -> List[Any]:
+    return [hit["id"] for hit in hits if hit["id"] != own_id][:limit]
+
+
+def _sample_points(
+    qdrant: QdrantManager,
+    collection_name: str,
+    sample_size: int
+) -> Tuple[List[Any], List[List[float]]]:
+    # Point ids are random UUIDs, so the first points in id order are a
+    # uniform sample
+    ids: List[Any] = []
+    vectors: List[List[float]] = []
+    for points in qdrant.iter_points(
+        collection_name, batch_size=min(sample_size, 1000), with_payload=False, with_vectors=True
+    ):
+        ids.extend(point.id for point in points)
+        vectors.extend(point.vector for point in points)
+        if len(vectors) >= sample_size:
+            break
+    return ids[:sample_size], vectors[:sample_size]
@@ -1,87 +1,682 @@
 """Embedding generators using CLIP and OpenAI models."""
 
+import asyncio
+import base64
+import contextlib
 import logging
-import requests
-from typing import List, Optional
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from PIL import Image
-import io
-import torch
-from transformers import CLIPProcessor, CLIPModel
-import openai
+import numpy as np
 from abc import ABC, abstractmethod
 
+from .embedding_cache import EmbeddingCache
+from .image_fetcher import ImageFetcher
+from .preprocessing import to_pixel_values
+from .rate_limit import AsyncRateLimiter
+
 logger = logging.getLogger(__name__)
 
+# torch, transformers and openai take seconds to import, so they are imported
+# inside the methods that use them rather than at module level.
+
 
 class BaseEmbedder(ABC):
     @abstractmethod
-    def get_embedding(self, input_data: str) -> Optional[List[float]]:
+    def get_embedding(self, input_data: str) -> Optional[np.ndarray]:
         pass
 
 
+@dataclass
+class ImageBatch:
+    """Images of one batch that still need embedding, and the batch's output rows."""
+    
+    embeddings: np.ndarray
+    valid: List[bool]
+    images: List[Image.Image] = field(default_factory=list)
+    indices: List[int] = field(default_factory=list)
+    keys: List[str] = field(default_factory=list)
+
+
 class CLIPEmbedder(BaseEmbedder):
-    def __init__(self, model_name: str = "openai/clip-vit-large-patch14"):
+    """CLIP image and text embeddings.
+    
+    ``towers`` selects which halves of the model to load: "vision" and
+    "text" load only the projection model a workload needs, roughly halving
+    memory and load time. Asking a single-tower embedder for the other kind
+    of embedding upgrades it to the full model.
+    
+    ``model_path`` points at a local snapshot directory of ``model_name``
+    (config, processor files and safetensors weights). It is loaded without
+    any hub lookups and its weights are memory-mapped, so processes on one
+    host share a single page-cached copy.
+    """
+    
+    INFERENCE_MODES = ("fp32", "int8", "bf16")
+    TOWERS = ("both", "vision", "text")
+    TEXT_BATCH_SIZE = 64
+    
+    def __init__(
+        self, 
+        model_name: str = "openai/clip-vit-large-patch14",
+        image_fetcher: Optional[ImageFetcher] = None,
+        cache: Optional[EmbeddingCache] = None,
+        inference_mode: str = "fp32",
+        num_threads: Optional[int] = None,
+        towers: str = "both",
+        model_path: Optional[str] = None
+    ):
+        if inference_mode not in self.INFERENCE_MODES:
+            raise ValueError(f"Unknown inference mode '{inference_mode}', expected one of {self.INFERENCE_MODES}")
+        if towers not in self.TOWERS:
+            raise ValueError(f"Unknown towers '{towers}', expected one of {self.TOWERS}")
+        
+        import torch
+        from transformers import CLIPProcessor
+        
+        self.cache = cache
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         logger.info(f"Using device: {self.device}")
         
+        if num_threads:
+            torch.set_num_threads(num_threads)
+            logger.info(f"Using {num_threads} intra-op threads")
+        
         self.model_name = model_name
-        logger.info(f"Loading CLIP model: {model_name}")
-        self.model = CLIPModel.from_pretrained(model_name).to(self.device)
-        self.processor = CLIPProcessor.from_pretrained(model_name)
-        logger.info("CLIP model loaded successfully")
+        self.model_path = model_path
+        self.processor = CLIPProcessor.from_pretrained(
+            model_path or model_name, local_files_only=model_path is not None
+        )
+        self.image_size = self.processor.image_processor.crop_size["height"]
+        self.image_fetcher = image_fetcher or ImageFetcher(image_size=self.image_size)
+        self._load_lock = threading.Lock()
+        self._load_model(towers, inference_mode)
     
-    def get_image_embedding(self, image_url: str) -> Optional[List[float]]:
-        try:
-            response = requests.get(image_url, timeout=10)
-            response.raise_for_status()
-            image = Image.open(io.BytesIO(response.content)).convert("RGB")
-            inputs = self.processor(images=image, return_tensors="pt").to(self.device)
-
-            with torch.no_grad():
-                embedding = self.model.get_image_features(**inputs)
-
-            embedding /= embedding.norm(p=2, dim=-1, keepdim=True)
-            return embedding.cpu().numpy().flatten().tolist()
-
-        except Exception as e:
-            logger.warning(f"Failed to process image '{image_url}': {e}")
+    def _load_model(self, towers: str, inference_mode: str) -> None:
+        from transformers import CLIPConfig, CLIPModel, CLIPTextModelWithProjection, CLIPVisionModelWithProjection
+        
+        from .model_loading import load_mmap_model
+        
+        logger.info(f"Loading CLIP model: {self.model_path or self.model_name} ({towers})")
+        source = self.model_path or self.model_name
+        config = CLIPConfig.from_pretrained(source, local_files_only=self.model_path is not None)
+        model_class, model_config = {
+            "both": (CLIPModel, config),
+            "vision": (CLIPVisionModelWithProjection, config.vision_config),
+            "text": (CLIPTextModelWithProjection, config.text_config)
+        }[towers]
+        # Tower configs don't always carry the checkpoint's projection size
+        model_config.projection_dim = config.projection_dim
+        
+        if self.model_path:
+            model = load_mmap_model(model_class, self.model_path, model_config)
+        else:
+            model = model_class.from_pretrained(self.model_name, config=model_config)
+        
+        model, inference_mode = self._apply_inference_mode(model.to(self.device), inference_mode)
+        model.eval()
+        self.projection_dim = model.config.projection_dim
+        self.inference_mode = inference_mode
+        # Published as one assignment so readers never pair a model with the
+        # wrong towers
+        self._loaded = (model, towers)
+        logger.info(f"CLIP model loaded successfully ({self.inference_mode})")
+    
+    @property
+    def model(self):
+        return self._loaded[0]
+    
+    @property
+    def towers(self) -> str:
+        return self._loaded[1]
+    
+    def _require_tower(self, tower: str) -> Tuple[Any, str]:
+        """The loaded ``(model, towers)``, upgraded to the full model if it lacks ``tower``."""
+        loaded = self._loaded
+        if loaded[1] in ("both", tower):
+            return loaded
+        
+        with self._load_lock:
+            if self._loaded[1] not in ("both", tower):
+                logger.info(f"{tower.capitalize()} tower requested, upgrading to the full CLIP model")
+                self._load_model("both", self.inference_mode)
+            return self._loaded
+    
+    @property
+    def cache_model_name(self) -> str:
+        # Reduced-precision modes drift slightly, so keep their vectors apart
+        if self.inference_mode == "fp32":
+            return self.model_name
+        return f"{self.model_name}@{self.inference_mode}"
+    
+    def _apply_inference_mode(self, model, mode: str) -> Tuple[Any, str]:
+        import torch
+        
+        if mode == "int8":
+            if self.device != "cpu":
+                logger.warning("int8 dynamic quantization is CPU-only, falling back to fp32")
+                return model, "fp32"
+            model = torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        elif mode == "bf16" and self.device == "cpu" and not _cpu_supports_bf16():
+            logger.warning("CPU lacks native bf16 support, falling back to fp32")
+            return model, "fp32"
+        return model, mode
+    
+    def _inference_context(self):
+        import torch
+        
+        if self.inference_mode == "bf16":
+            return torch.autocast(device_type=self.device, dtype=torch.bfloat16)
+        return contextlib.nullcontext()
+    
+    def get_image_embedding(self, image_url: str) -> Optional[np.ndarray]:
+        embeddings, valid = self.get_image_embeddings([image_url])
+        if not valid[0]:
             return None
+        return embeddings[0]
     
-    def get_text_embedding(self, text: str) -> Optional[List[float]]:
-        try:
-            inputs = self.processor(text=text, return_tensors="pt").to(self.device)
-            
-            with torch.no_grad():
-                embedding = self.model.get_text_features(**inputs)
-            
-            embedding /= embedding.norm(p=2, dim=-1, keepdim=True)
-            return embedding.cpu().numpy().flatten().tolist()
+    def get_image_embeddings(
+        self, urls_or_images: Sequence[Union[str, Image.Image, None]]
+    ) -> Tuple[np.ndarray, List[bool]]:
+        """Embed many images with a single forward pass.
+        
+        Returns a float32 matrix with one L2-normalized row per input and a
+        list of flags marking which rows are valid. Rows for inputs that could
+        not be loaded or embedded (including None placeholders) are left as
+        zeros.
+        """
+        batch = self.prepare_image_batch(urls_or_images)
+        
+        if batch.images:
+            try:
+                features = self.embed_images(batch.images)
+            except Exception as e:
+                logger.warning(f"Failed to process batch of {len(batch.images)} images: {e}")
+                features = None
+            self.complete_image_batch(batch, features)
+        
+        return batch.embeddings, batch.valid
+    
+    def prepare_image_batch(self, urls_or_images: Sequence[Union[str, Image.Image]]) -> "ImageBatch":
+        """Load the inputs and fill in cached rows; what is left needs a forward pass."""
+        batch = ImageBatch(
+            embeddings=np.zeros(
+                (len(urls_or_images), self.projection_dim), dtype=np.float32
+            ),
+            valid=[False] * len(urls_or_images)
+        )
+        
+        urls = [item for item in urls_or_images if isinstance(item, str)]
+        fetched = self.image_fetcher.fetch_many(urls)
+        
+        for i, item in enumerate(urls_or_images):
+            image = next(fetched) if isinstance(item, str) else self._load_image(item)
+            if image is not None:
+                batch.images.append(image)
+                batch.indices.append(i)
+        
+        if self.cache is not None:
+            keys = [EmbeddingCache.image_key(image) for image in batch.images]
+            cached = self.cache.get_many(self.cache_model_name, keys)
+            misses = [j for j, key in enumerate(keys) if key not in cached]
+            for j, key in enumerate(keys):
+                if key in cached:
+                    batch.embeddings[batch.indices[j]] = cached[key]
+                    batch.valid[batch.indices[j]] = True
             
+            batch.images = [batch.images[j] for j in misses]
+            batch.indices = [batch.indices[j] for j in misses]
+            batch.keys = [keys[j] for j in misses]
+        
+        return batch
+    
+    def embed_images(self, images: Sequence[Image.Image]) -> np.ndarray:
+        """Run one forward pass and return L2-normalized float32 features."""
+        import torch
+        
+        model, towers = self._require_tower("vision")
+        pixel_values = to_pixel_values(
+            images,
+            self.image_size,
+            self.processor.image_processor.image_mean,
+            self.processor.image_processor.image_std
+        ).to(self.device)
+        
+        with torch.no_grad(), self._inference_context():
+            if towers == "vision":
+                features = model(pixel_values=pixel_values).image_embeds.float()
+            else:
+                features = model.get_image_features(pixel_values=pixel_values).float()
+        
+        features /= features.norm(p=2, dim=-1, keepdim=True)
+        return features.cpu().numpy().astype(np.float32, copy=False)
+    
+    def complete_image_batch(self, batch: "ImageBatch", features: Optional[np.ndarray]) -> None:
+        if features is None:
+            return
+        
+        batch.embeddings[batch.indices] = features
+        for i in batch.indices:
+            batch.valid[i] = True
+        
+        if self.cache is not None:
+            self.cache.put_many(self.cache_model_name, dict(zip(batch.keys, features)))
+    
+    def _load_image(self, image: Optional[Image.Image]) -> Optional[Image.Image]:
+        if image is None:
+            return None
+        
+        try:
+            return image.convert("RGB")
         except Exception as e:
-            logger.warning(f"Failed to process text '{text}': {e}")
+            logger.warning(f"Failed to convert image: {e}")
             return None
     
-    def get_embedding(self, input_data: str) -> Optional[List[float]]:
+    def get_text_embedding(self, text: str) -> Optional[np.ndarray]:
+        embeddings, valid = self.get_text_embeddings([text])
+        if not valid[0]:
+            return None
+        return embeddings[0]
+    
+    def get_text_embeddings(self, texts: Sequence[str]) -> Tuple[np.ndarray, List[bool]]:
+        """Embed texts with the text tower, ``TEXT_BATCH_SIZE`` per forward pass.
+        
+        Same result layout as ``get_image_embeddings``. Texts longer than
+        CLIP's context window are truncated.
+        """
+        embeddings = np.zeros((len(texts), self.projection_dim), dtype=np.float32)
+        valid = [False] * len(texts)
+        pending = list(range(len(texts)))
+        keys: List[str] = []
+        
+        if self.cache is not None:
+            keys = [EmbeddingCache.text_key(text) for text in texts]
+            cached = self.cache.get_many(self.cache_model_name, keys)
+            for i, key in enumerate(keys):
+                if key in cached:
+                    embeddings[i] = cached[key]
+                    valid[i] = True
+            pending = [i for i in pending if not valid[i]]
+        
+        for start in range(0, len(pending), self.TEXT_BATCH_SIZE):
+            indices = pending[start:start + self.TEXT_BATCH_SIZE]
+            try:
+                features = self.embed_texts([texts[i] for i in indices])
+            except Exception as e:
+                logger.warning(f"Failed to process batch of {len(indices)} texts: {e}")
+                continue
+            
+            embeddings[indices] = features
+            for i in indices:
+                valid[i] = True
+            if self.cache is not None:
+                self.cache.put_many(
+                    self.cache_model_name, {keys[i]: embeddings[i] for i in indices}
+                )
+        
+        return embeddings, valid
+    
+    def embed_texts(self, texts: Sequence[str]) -> np.ndarray:
+        """Run one text forward pass and return L2-normalized float32 features."""
+        import torch
+        
+        model, towers = self._require_tower("text")
+        inputs = self.processor(
+            text=list(texts), return_tensors="pt", padding=True, truncation=True
+        ).to(self.device)
+        
+        with torch.no_grad(), self._inference_context():
+            if towers == "text":
+                features = model(**inputs).text_embeds.float()
+            else:
+                features = model.get_text_features(**inputs).float()
+        
+        features /= features.norm(p=2, dim=-1, keepdim=True)
+        return features.cpu().numpy().astype(np.float32, copy=False)
+    
+    def get_embedding(self, input_data: str) -> Optional[np.ndarray]:
         if input_data.startswith(('http://', 'https://')):
             return self.get_image_embedding(input_data)
         else:
             return self.get_text_embedding(input_data)
 
 
+def _cpu_supports_bf16() -> bool:
+    import torch
+    
+    try:
+        return bool(torch.ops.mkldnn._is_mkldnn_bf16_supported())
+    except Exception:
+        return False
+
+
+def _decode_embedding(data: Union[str, List[float]]) -> np.ndarray:
+    # base64-encoded little-endian float32, decoded without building a list
+    if isinstance(data, str):
+        return np.frombuffer(base64.b64decode(data), dtype="<f4").astype(np.float32)
+    return np.asarray(data, dtype=np.float32)
+
+
+def _stack_embeddings(embeddings: List[Optional[np.ndarray]]) -> Tuple[np.ndarray, List[bool]]:
+    valid = [embedding is not None for embedding in embeddings]
+    dim = next((embedding.shape[0] for embedding in embeddings if embedding is not None), 0)
+    matrix = np.zeros((len(embeddings), dim), dtype=np.float32)
+    for i, embedding in enumerate(embeddings):
+        if embedding is not None:
+            matrix[i] = embedding
+    return matrix, valid
+
+
 class OpenAIEmbedder(BaseEmbedder):
-    def __init__(self, api_key: str, model: str = "text-embedding-3-small"):
+    # Per-request limits of the embeddings endpoint
+    MAX_BATCH_ITEMS = 2048
+    MAX_BATCH_TOKENS = 300_000
+    MAX_INPUT_TOKENS = 8191
+    
+    def __init__(
+        self, 
+        api_key: str, 
+        model: str = "text-embedding-3-small",
+        cache: Optional[EmbeddingCache] = None,
+        max_retries: int = 8
+    ):
         self.api_key = api_key
         self.model = model
+        self.cache = cache
+        self.max_batch_items = self.MAX_BATCH_ITEMS
+        self.max_retries = max_retries
+        
+        import openai
+        
         openai.api_key = api_key
+        self._encoding = self._load_encoding(model)
         logger.info(f"OpenAI embedder initialized with model: {model}")
     
-    def get_embedding(self, text: str) -> Optional[List[float]]:
+    def get_embedding(self, text: str) -> Optional[np.ndarray]:
+        embeddings, keys, pending = self._lookup_cached([text])
+        if pending:
+            embeddings[0] = self._embed_one(text)
+            self._store_cached(keys, embeddings, pending)
+        return embeddings[0]
+    
+    def _embed_one(self, text: str) -> Optional[np.ndarray]:
         try:
-            response = openai.embeddings.create(
-                model=self.model,
-                input=text
-            )
-            return response.data[0].embedding
+            response = self._create_embeddings(text)
+            return _decode_embedding(response.data[0].embedding)
         except Exception as e:
             logger.error(f"Failed to generate OpenAI embedding: {e}")
             return None
+    
+    def _create_embeddings(self, texts: Union[str, List[str]]):
+        """``embeddings.create``, waiting out 429s for the server's Retry-After (or a backoff)."""
+        import openai
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                return openai.embeddings.create(
+                    model=self.model, input=texts, encoding_format="base64"
+                )
+            except openai.RateLimitError as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = _retry_after(e) or self._backoff(attempt)
+                logger.warning(f"Rate limited, retrying in {delay:.1f}s")
+                time.sleep(delay)
+    
+    def get_embeddings(self, texts: Sequence[str]) -> Tuple[np.ndarray, List[bool]]:
+        """Embed many texts, packing them into as few requests as the API allows.
+        
+        Returns a float32 matrix with one row per input, in input order, and a
+        list of flags marking which rows are valid. Rate-limited requests are
+        retried after the server's Retry-After, up to ``max_retries`` times.
+        Items of a failed request are retried one at a time; rows for items
+        that still fail (or exceed the per-input token limit) are left as zeros.
+        """
+        embeddings, keys, pending = self._lookup_cached(texts)
+        
+        for batch_indices, _ in self._pack_batches([texts[i] for i in pending]):
+            indices = [pending[j] for j in batch_indices]
+            batch = [texts[i] for i in indices]
+            try:
+                response = self._create_embeddings(batch)
+                for item in response.data:
+                    embeddings[indices[item.index]] = _decode_embedding(item.embedding)
+            except Exception as e:
+                logger.warning(f"Batch of {len(batch)} texts failed, retrying individually: {e}")
+                for i in indices:
+                    embeddings[i] = self._embed_one(texts[i])
+            
+            self._store_cached(keys, embeddings, indices)
+        
+        return _stack_embeddings(embeddings)
+    
+    def _lookup_cached(
+        self, texts: Sequence[str]
+    ) -> Tuple[List[Optional[np.ndarray]], List[str], List[int]]:
+        embeddings: List[Optional[np.ndarray]] = [None] * len(texts)
+        keys: List[str] = []
+        pending = list(range(len(texts)))
+        
+        if self.cache is not None:
+            keys = [EmbeddingCache.text_key(text) for text in texts]
+            cached = self.cache.get_many(self.model, keys)
+            for i, key in enumerate(keys):
+                if key in cached:
+                    embeddings[i] = cached[key]
+            pending = [i for i in pending if embeddings[i] is None]
+            logger.info(f"Embedding cache hit for {len(texts) - len(pending)} of {len(texts)} texts")
+        
+        return embeddings, keys, pending
+    
+    def _store_cached(
+        self, keys: List[str], embeddings: List[Optional[np.ndarray]], indices: List[int]
+    ) -> None:
+        if self.cache is not None:
+            self.cache.put_many(self.model, {
+                keys[i]: embeddings[i] for i in indices if embeddings[i] is not None
+            })
+    
+    def _pack_batches(self, texts: Sequence[str]) -> List[Tuple[List[int], int]]:
+        """Group text indices into requests; returns (indices, token count) pairs."""
+        batches = []
+        current: List[int] = []
+        current_tokens = 0
+        
+        for i, text in enumerate(texts):
+            tokens = self._count_tokens(text)
+            if tokens > self.MAX_INPUT_TOKENS:
+                logger.warning(f"Skipping text {i}: {tokens} tokens exceeds the per-input limit")
+                continue
+            
+            if current and (
+                len(current) >= self.max_batch_items
+                or current_tokens + tokens > self.MAX_BATCH_TOKENS
+            ):
+                batches.append((current, current_tokens))
+                current = []
+                current_tokens = 0
+            
+            current.append(i)
+            current_tokens += tokens
+        
+        if current:
+            batches.append((current, current_tokens))
+        
+        return batches
+    
+    def _count_tokens(self, text: str) -> int:
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        # Counting bytes rather than characters covers CJK and emoji (3-4
+        # bytes each); English averages ~4 bytes per token, so this errs high
+        return len(text.encode()) // 2 + 1
+    
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        # Full jitter keeps retrying clients from synchronizing
+        return random.uniform(0, min(60.0, 0.5 * 2 ** attempt))
+    
+    @staticmethod
+    def _load_encoding(model: str):
+        try:
+            import tiktoken
+            return tiktoken.encoding_for_model(model)
+        except Exception:
+            logger.debug("tiktoken unavailable, estimating token counts from UTF-8 length")
+            return None
+
+
+class AsyncOpenAIEmbedder(OpenAIEmbedder):
+    """OpenAI embedder that keeps many requests in flight under rate limits.
+    
+    Requests are admitted by an ``AsyncRateLimiter`` sized to the account's
+    requests- and tokens-per-minute limits. 429s pause all requests for the
+    server's Retry-After (or a jittered exponential backoff) and are retried,
+    so items are not dropped when the limit is hit. ``base_url`` can point at
+    a local mock server.
+    """
+    
+    def __init__(
+        self, 
+        api_key: str, 
+        model: str = "text-embedding-3-small",
+        cache: Optional[EmbeddingCache] = None,
+        base_url: Optional[str] = None,
+        requests_per_minute: int = 3000,
+        tokens_per_minute: int = 1_000_000,
+        max_concurrency: int = 16,
+        max_batch_items: int = 256,
+        max_retries: int = 8
+    ):
+        super().__init__(api_key, model, cache, max_retries)
+        self.base_url = base_url
+        self.max_concurrency = max_concurrency
+        self.max_batch_items = max_batch_items
+        self.limiter = AsyncRateLimiter(requests_per_minute, tokens_per_minute)
+        self.last_run_stats: Dict[str, float] = {}
+        self._clients: Dict[int, Any] = {}
+    
+    def get_embeddings(self, texts: Sequence[str]) -> Tuple[np.ndarray, List[bool]]:
+        return asyncio.run(self.aget_embeddings(texts))
+    
+    async def aget_embedding(self, text: str) -> Optional[np.ndarray]:
+        embeddings, valid = await self.aget_embeddings([text])
+        return embeddings[0] if valid[0] else None
+    
+    async def aget_embeddings(self, texts: Sequence[str]) -> Tuple[np.ndarray, List[bool]]:
+        """Embed many texts concurrently; same result layout as ``get_embeddings``."""
+        embeddings, keys, pending = self._lookup_cached(texts)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        stats = {"requests": 0, "retries": 0, "rate_limited": 0, "tokens": 0}
+        start = time.perf_counter()
+        
+        async def run(batch_indices: List[int], tokens: int) -> None:
+            indices = [pending[j] for j in batch_indices]
+            async with semaphore:
+                results = await self._embed_batch([texts[i] for i in indices], tokens, stats)
+            for i, embedding in zip(indices, results):
+                embeddings[i] = embedding
+            self._store_cached(keys, embeddings, indices)
+        
+        await asyncio.gather(*(
+            run(batch_indices, tokens)
+            for batch_indices, tokens in self._pack_batches([texts[i] for i in pending])
+        ))
+        
+        elapsed = time.perf_counter() - start
+        embedded = sum(1 for i in pending if embeddings[i] is not None)
+        self.last_run_stats = {
+            **stats,
+            "items": embedded,
+            "failed": len(pending) - embedded,
+            "seconds": elapsed,
+            "items_per_sec": embedded / elapsed if elapsed else 0.0,
+            "tokens_per_min": stats["tokens"] * 60 / elapsed if elapsed else 0.0
+        }
+        if pending:
+            logger.info(
+                f"Embedded {embedded}/{len(pending)} texts in {elapsed:.1f}s "
+                f"({self.last_run_stats['items_per_sec']:.0f} items/s, "
+                f"{self.last_run_stats['tokens_per_min']:.0f} tokens/min, "
+                f"{stats['rate_limited']} rate limited)"
+            )
+        
+        return _stack_embeddings(embeddings)
+    
+    async def _embed_batch(
+        self, batch: List[str], tokens: int, stats: Dict[str, int]
+    ) -> List[Optional[np.ndarray]]:
+        import openai
+        
+        client = self._get_client()
+        delay = 0.0
+        
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                stats["retries"] += 1
+                await asyncio.sleep(delay)
+            await self.limiter.acquire(tokens)
+            stats["requests"] += 1
+            try:
+                response = await client.embeddings.create(
+                    model=self.model, input=batch, encoding_format="base64"
+                )
+                stats["tokens"] += tokens
+                results: List[Optional[np.ndarray]] = [None] * len(batch)
+                for item in response.data:
+                    results[item.index] = _decode_embedding(item.embedding)
+                return results
+            
+            except openai.RateLimitError as e:
+                stats["rate_limited"] += 1
+                # The limiter holds back every request, this one included
+                self.limiter.pause(_retry_after(e) or self._backoff(attempt))
+                delay = 0.0
+            except (openai.APIConnectionError, openai.APITimeoutError, openai.InternalServerError) as e:
+                logger.warning(f"Embedding request failed: {e}")
+                delay = self._backoff(attempt)
+            except openai.BadRequestError as e:
+                if len(batch) == 1:
+                    logger.error(f"Failed to generate OpenAI embedding: {e}")
+                    return [None]
+                # One bad input rejects the whole request; isolate it
+                logger.warning(f"Batch of {len(batch)} texts rejected, retrying individually: {e}")
+                return [
+                    (await self._embed_batch([text], self._count_tokens(text), stats))[0]
+                    for text in batch
+                ]
+        
+        logger.error(f"Giving up on batch of {len(batch)} texts after {self.max_retries} retries")
+        return [None] * len(batch)
+    
+    def _get_client(self):
+        # httpx clients are bound to the loop they were first used on
+        import openai
+        
+        loop = id(asyncio.get_running_loop())
+        if loop not in self._clients:
+            self._clients = {loop: openai.AsyncOpenAI(
+                api_key=self.api_key, base_url=self.base_url, max_retries=0
+            )}
+        return self._clients[loop]
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    
+    headers = response.headers
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except ValueError:
+        pass
+    return None
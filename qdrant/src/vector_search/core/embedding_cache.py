@@ -0,0 +1,250 @@
+"""Persistent, content-addressed cache of computed embeddings."""
+
+import contextlib
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from .preprocessing import SOURCE_DIGEST_INFO
+
+logger = logging.getLogger(__name__)
+
+_INITIAL_CAPACITY = 1024
+
+
+class EmbeddingCache:
+    """On-disk embedding store shared by the embedders.
+
+    Entries are keyed by (model name, content hash). Vectors live in one
+    memory-mapped float32 file per dimensionality; an SQLite index maps each
+    key to its row. When the cache grows past ``max_bytes`` the least
+    recently used entries are evicted and their rows reused.
+
+    Several processes may share one cache directory: rows are claimed
+    inside SQLite write transactions, and a process remaps a vector file
+    that another one has grown.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 2 * 1024 ** 3):
+        self.path = Path(path).expanduser()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._arrays: Dict[int, np.memmap] = {}
+        # Transactions are opened explicitly, see _write_transaction
+        self._db = sqlite3.connect(
+            str(self.path / "index.sqlite"), timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._db.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS entries (
+                model TEXT NOT NULL,
+                key TEXT NOT NULL,
+                dim INTEGER NOT NULL,
+                slot INTEGER NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (model, key)
+            );
+            CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used);
+            CREATE TABLE IF NOT EXISTS free_slots (
+                dim INTEGER NOT NULL,
+                slot INTEGER NOT NULL,
+                PRIMARY KEY (dim, slot)
+            );
+            CREATE TABLE IF NOT EXISTS arrays (
+                dim INTEGER PRIMARY KEY,
+                next_slot INTEGER NOT NULL
+            );
+            """
+        )
+        logger.info(f"Embedding cache opened at {self.path}")
+
+    @staticmethod
+    def text_key(text: str) -> str:
+        normalized = " ".join(unicodedata.normalize("NFC", text).split())
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def image_key(image: Image.Image) -> str:
+        """Hash of the file the image was downloaded as, or of its pixels.
+
+        ``ImageFetcher`` records the digest of the raw bytes on each image it
+        decodes, so the key doesn't depend on how the image was decoded.
+        """
+        source_digest = image.info.get(SOURCE_DIGEST_INFO)
+        if source_digest:
+            return source_digest
+
+        digest = hashlib.sha256(f"{image.mode}:{image.size}".encode("utf-8"))
+        digest.update(image.tobytes())
+        return digest.hexdigest()
+
+    def get_many(self, model: str, keys: Iterable[str]) -> Dict[str, np.ndarray]:
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, np.ndarray] = {}
+        if not keys:
+            return found
+
+        # One write transaction from lookup to copy: another process can't
+        # evict a slot and hand it to a different key while it is read here
+        with self._lock, self._write_transaction():
+            rows: List[Tuple[str, int, int]] = []
+            for chunk in _chunks(keys, 500):
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(self._db.execute(
+                    f"SELECT key, dim, slot FROM entries WHERE model = ? AND key IN ({placeholders})",
+                    [model, *chunk]
+                ))
+
+            for key, dim, slot in rows:
+                array = self._array(dim, slot + 1)
+                if array is not None and slot < array.shape[0]:
+                    found[key] = np.array(array[slot])
+
+            if found:
+                now = time.time()
+                self._db.executemany(
+                    "UPDATE entries SET last_used = ? WHERE model = ? AND key = ?",
+                    [(now, model, key) for key in found]
+                )
+
+        return found
+
+    def put_many(self, model: str, vectors: Dict[str, np.ndarray]) -> None:
+        if not vectors:
+            return
+
+        with self._lock, self._write_transaction():
+            now = time.time()
+            for key, vector in vectors.items():
+                vector = np.asarray(vector, dtype=np.float32).ravel()
+                dim = vector.shape[0]
+
+                row = self._db.execute(
+                    "SELECT dim, slot FROM entries WHERE model = ? AND key = ?", (model, key)
+                ).fetchone()
+                if row and row[0] == dim:
+                    slot = row[1]
+                else:
+                    if row:
+                        self._release(row[0], row[1])
+                    slot = self._allocate(dim)
+
+                array = self._array(dim, slot + 1)
+                if array is None or slot >= array.shape[0]:
+                    array = self._grow(dim, slot + 1)
+                array[slot] = vector
+                self._db.execute(
+                    "INSERT OR REPLACE INTO entries (model, key, dim, slot, last_used) VALUES (?, ?, ?, ?, ?)",
+                    (model, key, dim, slot, now)
+                )
+
+            for array in self._arrays.values():
+                array.flush()
+            self._evict()
+
+    def size_bytes(self) -> int:
+        row = self._db.execute("SELECT COALESCE(SUM(dim), 0) FROM entries").fetchone()
+        return int(row[0]) * 4
+
+    def close(self) -> None:
+        with self._lock:
+            for array in self._arrays.values():
+                array.flush()
+            self._arrays.clear()
+            self._db.close()
+
+    def _allocate(self, dim: int) -> int:
+        row = self._db.execute("SELECT slot FROM free_slots WHERE dim = ? LIMIT 1", (dim,)).fetchone()
+        if row:
+            self._db.execute("DELETE FROM free_slots WHERE dim = ? AND slot = ?", (dim, row[0]))
+            return row[0]
+
+        row = self._db.execute("SELECT next_slot FROM arrays WHERE dim = ?", (dim,)).fetchone()
+        slot = row[0] if row else 0
+        self._db.execute("INSERT OR REPLACE INTO arrays (dim, next_slot) VALUES (?, ?)", (dim, slot + 1))
+        return slot
+
+    def _release(self, dim: int, slot: int) -> None:
+        self._db.execute("INSERT OR IGNORE INTO free_slots (dim, slot) VALUES (?, ?)", (dim, slot))
+
+    def _evict(self) -> None:
+        excess = self.size_bytes() - self.max_bytes
+        if excess <= 0:
+            return
+
+        evicted = 0
+        for model, key, dim, slot in self._db.execute(
+            "SELECT model, key, dim, slot FROM entries ORDER BY last_used"
+        ).fetchall():
+            if excess <= 0:
+                break
+            self._db.execute("DELETE FROM entries WHERE model = ? AND key = ?", (model, key))
+            self._release(dim, slot)
+            excess -= dim * 4
+            evicted += 1
+
+        logger.debug(f"Evicted {evicted} entries from embedding cache")
+
+    @contextlib.contextmanager
+    def _write_transaction(self) -> Iterator[None]:
+        # IMMEDIATE takes the database write lock up front, so reading free
+        # slots and next_slot and claiming one is atomic across processes
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._db.rollback()
+            raise
+        self._db.commit()
+
+    def _array(self, dim: int, rows: int = 0) -> Optional[np.memmap]:
+        """The mapped vector file for ``dim``, remapped if it has fewer than ``rows`` rows.
+
+        Another process may have grown the file since it was mapped here.
+        None if the file doesn't exist yet.
+        """
+        array = self._arrays.get(dim)
+        if array is not None and array.shape[0] >= rows:
+            return array
+
+        file = self._array_path(dim)
+        capacity = file.stat().st_size // (dim * 4) if file.exists() else 0
+        if capacity == 0:
+            return None
+        if array is not None:
+            self._arrays.pop(dim).flush()
+        self._arrays[dim] = np.memmap(file, dtype=np.float32, mode="r+", shape=(capacity, dim))
+        return self._arrays[dim]
+
+    def _grow(self, dim: int, rows: int) -> np.memmap:
+        # Only called inside a write transaction, so no other process grows
+        # the file at the same time
+        file = self._array_path(dim)
+        if dim in self._arrays:
+            self._arrays.pop(dim).flush()
+
+        current = file.stat().st_size // (dim * 4) if file.exists() else 0
+        capacity = max(rows, current * 2, _INITIAL_CAPACITY)
+        with open(file, "ab") as f:
+            f.truncate(capacity * dim * 4)
+        self._arrays[dim] = np.memmap(file, dtype=np.float32, mode="r+", shape=(capacity, dim))
+        return self._arrays[dim]
+
+    def _array_path(self, dim: int) -> Path:
+        return self.path / f"vectors_{dim}.f32"
+
+
+def _chunks(items: List[str], size: int) -> Iterable[List[str]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
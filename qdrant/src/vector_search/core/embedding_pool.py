@@ -0,0 +1,140 @@
+"""Multi-process CLIP image embedding for CPU builds."""
+
+import logging
+import multiprocessing
+import os
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+from .embedders import CLIPEmbedder
+
+logger = logging.getLogger(__name__)
+
+# Pool start methods, safest first. "fork" is opt-in: by the time a build
+# starts a pool, scroll readers, HTTP pools and torch's intra-op threads are
+# running, and a forked child can inherit one of their locks held forever.
+START_METHODS = ("forkserver", "spawn", "fork")
+
+# Set in the parent before forking so workers share its weights copy-on-write;
+# built by the initializer instead with the other start methods.
+_worker_embedder: Optional[CLIPEmbedder] = None
+
+
+def _init_worker(num_threads: int, options: Optional[Dict[str, Any]]) -> None:
+    global _worker_embedder
+
+    import torch
+
+    torch.set_num_threads(num_threads)
+    if _worker_embedder is None:
+        _worker_embedder = CLIPEmbedder(**options)
+
+
+def _embed_in_worker(images: List[Image.Image]) -> Optional[np.ndarray]:
+    try:
+        return _worker_embedder.embed_images(images)
+    except Exception as e:
+        logger.warning(f"Worker {os.getpid()} failed to embed {len(images)} images: {e}")
+        return None
+
+
+class CLIPEmbeddingPool:
+    """Spreads CLIP forward passes over worker processes.
+
+    Each worker runs one batch at a time with its own intra-op thread count,
+    which scales better on many-core hosts than a single process. Image
+    loading and the embedding cache stay in the parent, which owns
+    ``embedder``.
+
+    Workers start with ``forkserver`` where available, else ``spawn``, and
+    load their own model; with the embedder's ``model_path`` the weights are
+    memory-mapped, so workers share one page-cached copy. ``start_method``
+    "fork" reuses the parent's loaded model instead, but is only safe if no
+    other threads are running when the pool starts.
+    """
+
+    def __init__(
+        self,
+        embedder: CLIPEmbedder,
+        num_workers: int,
+        threads_per_worker: Optional[int] = None,
+        start_method: Optional[str] = None
+    ):
+        global _worker_embedder
+
+        available = multiprocessing.get_all_start_methods()
+        if start_method is None:
+            start_method = "forkserver" if "forkserver" in available else "spawn"
+        if start_method not in START_METHODS or start_method not in available:
+            raise ValueError(f"Unsupported start method '{start_method}', expected one of {available}")
+
+        self.embedder = embedder
+        self.num_workers = num_workers
+        self.threads_per_worker = threads_per_worker or max(1, (os.cpu_count() or 1) // num_workers)
+
+        context = multiprocessing.get_context(start_method)
+        if start_method == "fork":
+            _worker_embedder = embedder
+            options = None
+        else:
+            options = {
+                "model_name": embedder.model_name,
+                "inference_mode": embedder.inference_mode,
+                "towers": embedder.towers,
+                "model_path": embedder.model_path
+            }
+
+        self._pool = context.Pool(
+            num_workers,
+            initializer=_init_worker,
+            initargs=(self.threads_per_worker, options)
+        )
+        logger.info(
+            f"Started {num_workers} CLIP workers with {self.threads_per_worker} threads each "
+            f"({context.get_start_method()})"
+        )
+
+    def map_image_batches(
+        self,
+        batches: Iterable[Tuple[Any, Sequence[Image.Image]]],
+        max_in_flight: Optional[int] = None
+    ) -> Iterator[Tuple[Any, np.ndarray, List[bool]]]:
+        """Embed ``(tag, images)`` batches and yield ``(tag, embeddings, valid)`` in order.
+
+        At most ``max_in_flight`` batches are queued at once, so the input
+        iterable is consumed only as fast as the workers keep up.
+        """
+        max_in_flight = max_in_flight or self.num_workers * 2
+        window = deque()
+
+        for tag, images in batches:
+            batch = self.embedder.prepare_image_batch(images)
+            result = self._pool.apply_async(_embed_in_worker, (batch.images,)) if batch.images else None
+            window.append((tag, batch, result))
+
+            if len(window) >= max_in_flight:
+                yield self._complete(*window.popleft())
+
+        while window:
+            yield self._complete(*window.popleft())
+
+    def close(self) -> None:
+        global _worker_embedder
+
+        self._pool.close()
+        self._pool.join()
+        _worker_embedder = None
+
+    def __enter__(self) -> "CLIPEmbeddingPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _complete(self, tag: Any, batch, result) -> Tuple[Any, np.ndarray, List[bool]]:
+        if result is not None:
+            self.embedder.complete_image_batch(batch, result.get())
+        return tag, batch.embeddings, batch.valid
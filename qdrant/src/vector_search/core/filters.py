@@ -0,0 +1,60 @@
+"""Typed catalog filters for searches, and the payload indexes that serve them."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from qdrant_client.models import (
+    FieldCondition, Filter, MatchAny, MatchValue, PayloadSchemaType, Range
+)
+
+# Payload fields that ProductFilter filters on. Builds index them, so
+# filtered searches use the index instead of scanning payloads
+PAYLOAD_INDEXES: Dict[str, PayloadSchemaType] = {
+    "category_name": PayloadSchemaType.KEYWORD,
+    "subcategory_name": PayloadSchemaType.KEYWORD,
+    "price": PayloadSchemaType.FLOAT,
+    "rating_info.rating": PayloadSchemaType.FLOAT
+}
+
+
+@dataclass
+class ProductFilter:
+    """Conditions on catalog fields; unset fields don't filter.
+
+    ``category`` and ``subcategory`` take one name or several (any of them
+    matches). Price and rating bounds are inclusive.
+    """
+
+    category: Optional[Union[str, Sequence[str]]] = None
+    subcategory: Optional[Union[str, Sequence[str]]] = None
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+    min_rating: Optional[float] = None
+
+    def to_filter(self) -> Optional[Filter]:
+        conditions: List[FieldCondition] = []
+
+        for key, value in (("category_name", self.category), ("subcategory_name", self.subcategory)):
+            if value is None:
+                continue
+            if isinstance(value, str):
+                conditions.append(FieldCondition(key=key, match=MatchValue(value=value)))
+            else:
+                conditions.append(FieldCondition(key=key, match=MatchAny(any=list(value))))
+
+        if self.min_price is not None or self.max_price is not None:
+            conditions.append(FieldCondition(
+                key="price", range=Range(gte=self.min_price, lte=self.max_price)
+            ))
+
+        if self.min_rating is not None:
+            conditions.append(FieldCondition(key="rating_info.rating", range=Range(gte=self.min_rating)))
+
+        return Filter(must=conditions) if conditions else None
+
+
+def as_filter(value: Union[ProductFilter, Filter, Dict[str, Any], None]) -> Union[Filter, Dict[str, Any], None]:
+    """Qdrant filter for a ``ProductFilter``; raw filters pass through."""
+    if isinstance(value, ProductFilter):
+        return value.to_filter()
+    return value
@@ -0,0 +1,139 @@
+"""Concurrent image downloading with pooled HTTP connections."""
+
+import hashlib
+import io
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from PIL import Image
+
+from .image_store import ImageStore
+from .preprocessing import SOURCE_DIGEST_INFO, decode_image
+
+logger = logging.getLogger(__name__)
+
+
+class ImageFetcher:
+    """Downloads and decodes images on a bounded thread pool.
+
+    A single ``requests.Session`` is shared by all workers so connections to
+    each host are kept alive and reused across downloads. With a ``store``,
+    previously downloaded images are revalidated with conditional requests;
+    in ``offline`` mode they are served from the store without touching the
+    network at all. With ``image_size`` set, workers decode straight to a
+    square crop of that size, so decoding and resizing also run off the
+    caller's thread.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 16,
+        timeout: float = 10,
+        session: Optional[requests.Session] = None,
+        store: Optional[ImageStore] = None,
+        offline: bool = False,
+        image_size: Optional[int] = None
+    ):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.store = store
+        self.offline = offline
+        self.image_size = image_size
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def fetch(self, url: str) -> Optional[Image.Image]:
+        content = self.fetch_bytes(url)
+        if content is None:
+            return None
+
+        try:
+            if self.image_size:
+                image = decode_image(content, self.image_size)
+            else:
+                image = Image.open(io.BytesIO(content)).convert("RGB")
+        except Exception as e:
+            logger.warning(f"Failed to decode image '{url}': {e}")
+            return None
+
+        # Embedding cache key, independent of how the image was decoded
+        image.info[SOURCE_DIGEST_INFO] = hashlib.sha256(content).hexdigest()
+        return image
+
+    def fetch_bytes(self, url: str) -> Optional[bytes]:
+        cached = self.store.load(url) if self.store is not None else None
+
+        if self.offline:
+            if cached is None:
+                logger.warning(f"Image '{url}' is not available offline")
+                return None
+            return cached[0]
+
+        headers = ImageStore.conditional_headers(cached[1]) if cached else {}
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304 and cached:
+                return cached[0]
+
+            response.raise_for_status()
+            if self.store is not None:
+                self.store.save(url, response.content, response.headers)
+            return response.content
+
+        except Exception as e:
+            if cached:
+                logger.warning(f"Using cached copy of '{url}' after fetch failure: {e}")
+                return cached[0]
+            logger.warning(f"Failed to fetch image '{url}': {e}")
+            return None
+
+    def fetch_many(
+        self,
+        urls: Iterable[str],
+        prefetch: Optional[int] = None
+    ) -> Iterator[Optional[Image.Image]]:
+        """Yield decoded images in input order while later ones download.
+
+        At most ``prefetch`` downloads are in flight ahead of the consumer, so
+        memory stays bounded however many URLs are passed. Failed downloads
+        yield None.
+        """
+        prefetch = prefetch or self.max_workers * 2
+        executor = self._get_executor()
+        window = deque()
+
+        try:
+            for url in urls:
+                window.append(executor.submit(self.fetch, url))
+                if len(window) >= prefetch:
+                    yield window.popleft().result()
+
+            while window:
+                yield window.popleft().result()
+        finally:
+            for future in window:
+                future.cancel()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self.session.close()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="image-fetch"
+            )
+        return self._executor
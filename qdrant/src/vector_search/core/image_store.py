@@ -0,0 +1,133 @@
+"""On-disk store of downloaded images with HTTP validators."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ImageStore:
+    """Keeps raw image bytes keyed by URL, with their ETag/Last-Modified.
+
+    The stored validators let the fetcher revalidate with conditional
+    requests instead of downloading unchanged images again.
+
+    The store is kept under ``max_bytes``: loads refresh an image's mtime,
+    and once enough has been written the least recently used images are
+    deleted until the store is back to 90% of the budget.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 5 * 1024 ** 3):
+        self.path = Path(path).expanduser()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        # Scanning the store is not free, so check it only after writing a
+        # slice of the budget; the first save checks what earlier runs left
+        self._check_every = max(max_bytes // 16, 1)
+        self._written = self._check_every
+
+    def load(self, url: str) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        content_path, meta_path = self._paths(url)
+        try:
+            content = content_path.read_bytes()
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            os.utime(content_path)
+            return content, meta
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cached image for '{url}': {e}")
+            return None
+
+    def save(self, url: str, content: bytes, headers: Mapping[str, str]) -> None:
+        content_path, meta_path = self._paths(url)
+        meta = {
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified")
+        }
+        try:
+            self._write_atomic(content_path, content)
+            self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        except Exception as e:
+            logger.warning(f"Failed to cache image '{url}': {e}")
+            return
+
+        with self._lock:
+            self._written += len(content)
+            if self._written < self._check_every:
+                return
+            self._written = 0
+            self._evict()
+
+    @staticmethod
+    def conditional_headers(meta: Dict[str, Any]) -> Dict[str, str]:
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+
+        target = self.max_bytes * 0.9
+        evicted = 0
+        for _, size, content_path in sorted(entries):
+            if total <= target:
+                break
+            for path in (content_path, content_path.with_suffix(".json")):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            total -= size
+            evicted += 1
+        logger.info(f"Evicted {evicted} images from {self.path}")
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        # (mtime, size, path) of each stored image
+        entries = []
+        for directory in self.path.iterdir():
+            if not directory.is_dir():
+                continue
+            for entry in os.scandir(directory):
+                if entry.name.endswith(".bin"):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+        return entries
+
+    def _paths(self, url: str) -> Tuple[Path, Path]:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        directory = self.path / digest[:2]
+        return directory / f"{digest}.bin", directory / f"{digest}.json"
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
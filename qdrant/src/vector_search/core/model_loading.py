@@ -0,0 +1,129 @@
+"""Load model weights from local safetensors snapshots by memory-mapping them."""
+
+import json
+import logging
+import mmap
+import struct
+from pathlib import Path
+from typing import Dict, List, Union
+
+logger = logging.getLogger(__name__)
+
+SAFETENSORS_INDEX = "model.safetensors.index.json"
+SAFETENSORS_FILE = "model.safetensors"
+
+_DTYPES = {
+    "F64": "float64",
+    "F32": "float32",
+    "F16": "float16",
+    "BF16": "bfloat16",
+    "I64": "int64",
+    "I32": "int32",
+    "I16": "int16",
+    "I8": "int8",
+    "U8": "uint8",
+    "BOOL": "bool",
+}
+
+
+def safetensors_files(model_dir: Union[str, Path]) -> List[Path]:
+    """Weight files of a snapshot directory, following the shard index if present."""
+    model_dir = Path(model_dir)
+    index_path = model_dir / SAFETENSORS_INDEX
+
+    if index_path.exists():
+        with open(index_path) as f:
+            weight_map = json.load(f)["weight_map"]
+        return [model_dir / name for name in sorted(set(weight_map.values()))]
+
+    if (model_dir / SAFETENSORS_FILE).exists():
+        return [model_dir / SAFETENSORS_FILE]
+
+    raise FileNotFoundError(f"No safetensors weights found in {model_dir}")
+
+
+def mmap_safetensors(path: Union[str, Path]) -> Dict[str, "torch.Tensor"]:
+    """Map a safetensors file and return tensors that view the mapping.
+
+    The mapping is private copy-on-write: pages come straight from the page
+    cache, so every process that maps the same file shares them until a
+    tensor is written to.
+    """
+    import torch
+
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    (header_size,) = struct.unpack("<Q", buffer[:8])
+    header = json.loads(buffer[8:8 + header_size])
+    header.pop("__metadata__", None)
+    data_start = 8 + header_size
+
+    tensors = {}
+    for name, info in header.items():
+        dtype = getattr(torch, _DTYPES[info["dtype"]])
+        begin, end = info["data_offsets"]
+        count = (end - begin) // dtype.itemsize
+
+        if count == 0:
+            tensor = torch.empty(0, dtype=dtype)
+        else:
+            # frombuffer holds a reference to the mapping, keeping it open
+            tensor = torch.frombuffer(buffer, dtype=dtype, count=count, offset=data_start + begin)
+        tensors[name] = tensor.view(info["shape"])
+
+    return tensors
+
+
+def load_mmap_model(model_class, model_dir: Union[str, Path], config):
+    """Build ``model_class`` from ``config`` with weights mapped from ``model_dir``.
+
+    The model is created on the meta device, so no memory is allocated for
+    randomly initialized weights, and its parameters are then replaced by
+    views of the mapped files. Checkpoint keys the model does not use (e.g.
+    the other CLIP tower) are skipped without being read.
+    """
+    import torch
+
+    with torch.device("meta"):
+        model = model_class(config)
+
+    expected = model.state_dict()
+    state_dict = {}
+    converted = 0
+
+    for path in safetensors_files(model_dir):
+        for name, tensor in mmap_safetensors(path).items():
+            if name not in expected:
+                continue
+            target_dtype = expected[name].dtype
+            if tensor.dtype != target_dtype:
+                tensor = tensor.to(target_dtype)
+                converted += 1
+            state_dict[name] = tensor
+
+    missing = [name for name in expected if name not in state_dict]
+    if missing:
+        raise ValueError(f"Snapshot in {model_dir} is missing weights: {missing[:5]}")
+
+    model.load_state_dict(state_dict, strict=False, assign=True)
+    _materialize_buffers(model)
+
+    if converted:
+        logger.warning(f"Converted {converted} tensors to the model dtype; those are not shared")
+    return model
+
+
+def _materialize_buffers(model) -> None:
+    # Non-persistent buffers are not stored in checkpoints, so they are still
+    # on the meta device. The only ones CLIP has are position id ranges.
+    import torch
+
+    for module_name, module in model.named_modules():
+        for name, buffer in list(module.named_buffers(recurse=False)):
+            if not buffer.is_meta:
+                continue
+            if name != "position_ids":
+                raise ValueError(f"Cannot materialize buffer {module_name}.{name}")
+            positions = torch.arange(buffer.shape[-1], dtype=buffer.dtype).expand(buffer.shape)
+            module.register_buffer(name, positions, persistent=False)
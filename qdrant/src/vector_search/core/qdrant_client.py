@@ -1,34 +1,230 @@
 """Qdrant client wrapper for collection management and search."""
 
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+import time
+import uuid
+from typing import Iterator, List, Dict, Any, Optional, Tuple, Union
+import numpy as np
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
-    Distance, VectorParams, PointStruct, CollectionInfo,
-    OptimizersConfigDiff, HnswConfigDiff, SearchRequest
+    Batch, Distance, VectorParams, PointStruct, CollectionInfo, CollectionStatus,
+    OptimizersConfigDiff, HnswConfigDiff, SearchRequest, SearchParams, Record, PayloadSchemaType,
+    QuantizationConfig, QuantizationSearchParams, ScalarQuantization,
+    ScalarQuantizationConfig, ScalarType, ProductQuantization,
+    ProductQuantizationConfig, CompressionRatio, BinaryQuantization,
+    BinaryQuantizationConfig
 )
 
+from .bulk_upload import BulkUploader
+from .scroll import scroll_points
+
 logger = logging.getLogger(__name__)
 
+# Holds one point per collection whose payload describes how it was built
+METADATA_COLLECTION = "_collection_metadata"
+
+# Index settings for product collections (thresholds in kilobytes of vectors
+# per segment)
+HNSW_M = 16
+HNSW_EF_CONSTRUCT = 100
+INDEXING_THRESHOLD = 20000
+MEMMAP_THRESHOLD = 20000
+
+# Seconds between progress messages while waiting for indexing
+PROGRESS_LOG_INTERVAL = 30.0
+
+QUANTIZATION_TYPES = ("scalar", "product", "binary")
+
+
+def client_options(
+    url: str,
+    api_key: Optional[str] = None,
+    prefer_grpc: bool = False,
+    grpc_port: int = 6334,
+    timeout: Optional[int] = None,
+    http2: bool = False,
+    pool_size: Optional[int] = None
+) -> Dict[str, Any]:
+    """Keyword arguments for ``QdrantClient`` / ``AsyncQdrantClient``."""
+    options: Dict[str, Any] = {
+        "url": url,
+        "prefer_grpc": prefer_grpc,
+        "grpc_port": grpc_port,
+        "http2": http2
+    }
+    if api_key:
+        options["api_key"] = api_key
+    if timeout is not None:
+        options["timeout"] = timeout
+    if pool_size:
+        import httpx
+        
+        options["limits"] = httpx.Limits(
+            max_connections=pool_size, max_keepalive_connections=pool_size
+        )
+    return options
+
+
+def quantization_config(
+    quantization: Optional[str],
+    always_ram: bool = True
+) -> Optional[QuantizationConfig]:
+    """Collection quantization for one of ``QUANTIZATION_TYPES``.
+    
+    "scalar" stores int8 vectors (4x smaller), "product" 16x compressed
+    codes and "binary" one bit per dimension. With ``always_ram`` the
+    quantized vectors stay in memory even when the originals are on disk.
+    """
+    if not quantization:
+        return None
+    if quantization == "scalar":
+        return ScalarQuantization(scalar=ScalarQuantizationConfig(
+            type=ScalarType.INT8, quantile=0.99, always_ram=always_ram
+        ))
+    if quantization == "product":
+        return ProductQuantization(product=ProductQuantizationConfig(
+            compression=CompressionRatio.X16, always_ram=always_ram
+        ))
+    if quantization == "binary":
+        return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=always_ram))
+    raise ValueError(f"Unknown quantization {quantization!r}, expected one of {QUANTIZATION_TYPES}")
+
+
+def search_params(
+    collection_name: str,
+    query_vector: Union[np.ndarray, List[float]],
+    limit: int = 10,
+    score_threshold: Optional[float] = None,
+    filter_conditions: Optional[Dict] = None,
+    rescore: Optional[bool] = None,
+    oversampling: Optional[float] = None,
+    hnsw_ef: Optional[int] = None,
+    exact: bool = False,
+    indexed_only: bool = False
+) -> Dict[str, Any]:
+    """Keyword arguments for the client's ``search``.
+    
+    ``rescore`` and ``oversampling`` apply to quantized collections: fetch
+    ``oversampling`` times ``limit`` candidates by quantized score, then
+    (with ``rescore``) re-rank them with the original vectors. None keeps
+    the server default.
+    
+    ``hnsw_ef`` is the size of the HNSW candidate list (larger is slower
+    and more accurate; None uses the collection's ``ef_construct``).
+    ``exact`` skips the index for a full scan, and ``indexed_only`` skips
+    segments that are not indexed yet.
+    """
+    if isinstance(query_vector, np.ndarray):
+        # Cached query vectors are read-only; the client must not get a view
+        query_vector = query_vector.tolist()
+    
+    params = {
+        "collection_name": collection_name,
+        "query_vector": query_vector,
+        "limit": limit
+    }
+    
+    if score_threshold is not None:
+        params["score_threshold"] = score_threshold
+    
+    if filter_conditions is not None:
+        params["query_filter"] = filter_conditions
+    
+    quantization = None
+    if rescore is not None or oversampling is not None:
+        quantization = QuantizationSearchParams(rescore=rescore, oversampling=oversampling)
+    
+    if quantization is not None or hnsw_ef is not None or exact or indexed_only:
+        params["search_params"] = SearchParams(
+            hnsw_ef=hnsw_ef,
+            exact=exact,
+            indexed_only=indexed_only,
+            quantization=quantization
+        )
+    
+    return params
+
+
+def search_request(request: Dict[str, Any]) -> SearchRequest:
+    """``SearchRequest`` for one entry of a batch; takes ``search``'s keyword arguments."""
+    params = search_params(None, **request)
+    return SearchRequest(
+        vector=params["query_vector"],
+        limit=params["limit"],
+        score_threshold=params.get("score_threshold"),
+        filter=params.get("query_filter"),
+        params=params.get("search_params"),
+        with_payload=True
+    )
+
+
+def format_results(results) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": result.id,
+            "score": result.score,
+            "payload": result.payload
+        }
+        for result in results
+    ]
+
+
+def metadata_point_id(collection_name: str) -> str:
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"qdrant-collection:{collection_name}"))
+
+
+def metadata_from_points(points) -> Dict[str, Any]:
+    if not points:
+        return {}
+    metadata = dict(points[0].payload or {})
+    metadata.pop("collection", None)
+    return metadata
+
+
+def is_not_found(error: Exception) -> bool:
+    """Whether a client error means the collection doesn't exist (REST, gRPC or local mode)."""
+    if getattr(error, "status_code", None) == 404:
+        return True
+    code = getattr(error, "code", None)
+    if callable(code) and getattr(code(), "name", None) == "NOT_FOUND":
+        return True
+    return "not found" in str(error).lower()
+
 
 class QdrantManager:
     """Manages Qdrant operations for collections, points, and searches."""
     
-    def __init__(self, url: str, api_key: Optional[str] = None):
+    def __init__(
+        self, 
+        url: str, 
+        api_key: Optional[str] = None,
+        prefer_grpc: bool = False,
+        grpc_port: int = 6334,
+        timeout: Optional[int] = None,
+        http2: bool = False,
+        pool_size: Optional[int] = None
+    ):
+        """Connect to Qdrant.
+        
+        With ``prefer_grpc`` points and searches go over gRPC, which sends
+        vectors as packed floats instead of JSON number lists. ``http2`` and
+        ``pool_size`` (kept-alive connections) tune the REST transport, which
+        is still used for calls gRPC doesn't cover.
+        """
         self.url = url
         self.api_key = api_key
+        self.prefer_grpc = prefer_grpc
         
-        if api_key:
-            self.client = QdrantClient(url=url, api_key=api_key)
-        else:
-            self.client = QdrantClient(url=url)
+        self.client = QdrantClient(**client_options(
+            url, api_key, prefer_grpc, grpc_port, timeout, http2, pool_size
+        ))
         
-        logger.info(f"Connected to Qdrant at {url}")
+        logger.info(f"Connected to Qdrant at {url} ({'gRPC' if prefer_grpc else 'REST'})")
     
     def get_collections(self) -> List[str]:
         try:
             collections = self.client.get_collections()
-            return [col.name for col in collections.collections]
+            return [col.name for col in collections.collections if col.name != METADATA_COLLECTION]
         except Exception as e:
             logger.error(f"Failed to get collections: {e}")
             return []
@@ -47,8 +243,21 @@ class QdrantManager:
         self, 
         collection_name: str, 
         vector_size: int, 
-        distance: Distance = Distance.COSINE
+        distance: Distance = Distance.COSINE,
+        bulk_load: bool = False,
+        quantization: Optional[str] = None,
+        on_disk: bool = False
     ) -> bool:
+        """Create a collection with the product index settings.
+        
+        With ``bulk_load`` indexing is deferred: no HNSW graph (``m=0``) and
+        no segment is indexed (``indexing_threshold=0``), so upserts only
+        append. Call ``finish_bulk_load`` once everything is ingested.
+        
+        ``quantization`` is one of ``QUANTIZATION_TYPES``; the quantized
+        vectors are kept in RAM. ``on_disk`` stores the original vectors on
+        disk, where they are only read to rescore.
+        """
         try:
             if self.collection_exists(collection_name):
                 logger.warning(f"Collection {collection_name} already exists")
@@ -58,22 +267,126 @@ class QdrantManager:
                 collection_name=collection_name,
                 vectors_config=VectorParams(
                     size=vector_size,
-                    distance=distance
+                    distance=distance,
+                    on_disk=on_disk or None
                 ),
+                quantization_config=quantization_config(quantization),
                 optimizers_config=OptimizersConfigDiff(
-                    memmap_threshold=20000
+                    memmap_threshold=MEMMAP_THRESHOLD,
+                    indexing_threshold=0 if bulk_load else INDEXING_THRESHOLD
                 ),
                 hnsw_config=HnswConfigDiff(
-                    m=16,
-                    ef_construct=100
+                    m=0 if bulk_load else HNSW_M,
+                    ef_construct=HNSW_EF_CONSTRUCT
                 )
             )
-            logger.info(f"Created collection {collection_name}")
+            logger.info(f"Created collection {collection_name}{' for bulk load' if bulk_load else ''}")
             return True
         except Exception as e:
             logger.error(f"Failed to create collection {collection_name}: {e}")
             return False
     
+    def finish_bulk_load(
+        self, 
+        collection_name: str, 
+        timeout: Optional[float] = None,
+        poll_interval: float = 1.0,
+        indexing_threshold: int = INDEXING_THRESHOLD
+    ) -> bool:
+        """Restore the index settings deferred by ``bulk_load`` and wait for the index.
+        
+        Returns True once the optimizer reports the collection green, False
+        on failure or after ``timeout`` seconds.
+        """
+        try:
+            self.client.update_collection(
+                collection_name=collection_name,
+                optimizers_config=OptimizersConfigDiff(indexing_threshold=indexing_threshold),
+                hnsw_config=HnswConfigDiff(m=HNSW_M, ef_construct=HNSW_EF_CONSTRUCT)
+            )
+            logger.info(f"Restored index settings of {collection_name}, waiting for indexing")
+        except Exception as e:
+            logger.error(f"Failed to restore index settings of {collection_name}: {e}")
+            return False
+        
+        return self.wait_for_green(collection_name, timeout, poll_interval)
+    
+    def wait_for_green(
+        self, 
+        collection_name: str, 
+        timeout: Optional[float] = None,
+        poll_interval: float = 1.0
+    ) -> bool:
+        """Poll until the collection is green; False if it turns red or ``timeout`` passes.
+        
+        A grey collection has optimizations pending that Qdrant won't start
+        by itself (e.g. after a restart), so the optimizers are triggered
+        again, at most once per ``PROGRESS_LOG_INTERVAL``.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        next_report = time.monotonic() + PROGRESS_LOG_INTERVAL
+        next_trigger = time.monotonic()
+        
+        while True:
+            info = self.get_collection_info(collection_name)
+            if info is None or info.status == CollectionStatus.RED:
+                logger.error(f"Collection {collection_name} failed to optimize")
+                return False
+            if info.status == CollectionStatus.GREEN:
+                logger.info(f"Collection {collection_name} is indexed")
+                return True
+            
+            if info.status == CollectionStatus.GREY and time.monotonic() >= next_trigger:
+                logger.info(f"{collection_name} has pending optimizations, triggering the optimizers")
+                try:
+                    # An empty update is enough to start pending optimizations
+                    self.client.update_collection(
+                        collection_name=collection_name, optimizers_config=OptimizersConfigDiff()
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to trigger the optimizers of {collection_name}: {e}")
+                    return False
+                next_trigger = time.monotonic() + PROGRESS_LOG_INTERVAL
+            
+            if deadline is not None and time.monotonic() >= deadline:
+                logger.error(f"Timed out waiting for {collection_name} to be indexed")
+                return False
+            
+            if time.monotonic() >= next_report:
+                logger.info(
+                    f"{collection_name} is {info.status.value}: "
+                    f"{info.indexed_vectors_count or 0}/{info.points_count or 0} vectors indexed"
+                )
+                next_report += PROGRESS_LOG_INTERVAL
+            time.sleep(poll_interval)
+    
+    def create_payload_indexes(
+        self, 
+        collection_name: str, 
+        schema: Dict[str, PayloadSchemaType]
+    ) -> bool:
+        """Index the payload fields in ``schema`` that aren't indexed yet.
+        
+        Filters on indexed fields are resolved from the index, and HNSW
+        search stays fast under restrictive filters.
+        """
+        try:
+            info = self.client.get_collection(collection_name)
+            existing = info.payload_schema or {}
+            for field_name, field_schema in schema.items():
+                if field_name in existing:
+                    continue
+                self.client.create_payload_index(
+                    collection_name=collection_name,
+                    field_name=field_name,
+                    field_schema=field_schema
+                )
+                logger.info(f"Indexed payload field {field_name} of {collection_name}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to create payload indexes for {collection_name}: {e}")
+            return False
+    
     def delete_collection(self, collection_name: str) -> bool:
         try:
             if not self.collection_exists(collection_name):
@@ -81,6 +394,7 @@ class QdrantManager:
                 return True
             
             self.client.delete_collection(collection_name)
+            self._delete_collection_metadata(collection_name)
             logger.info(f"Deleted collection {collection_name}")
             return True
         except Exception as e:
@@ -91,10 +405,55 @@ class QdrantManager:
         self, 
         collection_name: str, 
         vector_size: int, 
-        distance: Distance = Distance.COSINE
+        distance: Distance = Distance.COSINE,
+        bulk_load: bool = False,
+        quantization: Optional[str] = None,
+        on_disk: bool = False
     ) -> bool:
         self.delete_collection(collection_name)
-        return self.create_collection(collection_name, vector_size, distance)
+        return self.create_collection(
+            collection_name, vector_size, distance, bulk_load, quantization, on_disk
+        )
+    
+    def get_collection_metadata(self, collection_name: str) -> Dict[str, Any]:
+        # One round trip; without a metadata collection nothing was recorded
+        try:
+            points = self.client.retrieve(
+                METADATA_COLLECTION, ids=[metadata_point_id(collection_name)], with_payload=True
+            )
+            return metadata_from_points(points)
+        except Exception as e:
+            if not is_not_found(e):
+                logger.error(f"Failed to get metadata for {collection_name}: {e}")
+            return {}
+    
+    def set_collection_metadata(self, collection_name: str, metadata: Dict[str, Any]) -> bool:
+        """Merge ``metadata`` into the stored metadata of ``collection_name``."""
+        try:
+            if not self.client.collection_exists(METADATA_COLLECTION):
+                self.client.create_collection(
+                    collection_name=METADATA_COLLECTION,
+                    vectors_config=VectorParams(size=1, distance=Distance.DOT)
+                )
+            
+            payload = {**self.get_collection_metadata(collection_name), **metadata}
+            payload["collection"] = collection_name
+            self.client.upsert(
+                collection_name=METADATA_COLLECTION,
+                points=[PointStruct(id=metadata_point_id(collection_name), vector=[1.0], payload=payload)]
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to set metadata for {collection_name}: {e}")
+            return False
+    
+    def _delete_collection_metadata(self, collection_name: str) -> None:
+        if self.client.collection_exists(METADATA_COLLECTION):
+            self.client.delete(METADATA_COLLECTION, points_selector=[metadata_point_id(collection_name)])
+    
+    def bulk_uploader(self, collection_name: str, **options) -> BulkUploader:
+        """Pipelined uploader for large builds; see ``BulkUploader`` for ``options``."""
+        return BulkUploader(self.client, collection_name, **options)
     
     def upsert_points(self, collection_name: str, points: List[PointStruct]) -> bool:
         try:
@@ -105,41 +464,76 @@ class QdrantManager:
             logger.error(f"Failed to upsert points to {collection_name}: {e}")
             return False
     
+    def upsert_vectors(
+        self, 
+        collection_name: str, 
+        ids: List[Union[str, int]], 
+        vectors: np.ndarray, 
+        payloads: List[Dict[str, Any]]
+    ) -> bool:
+        """Upsert a column-oriented batch straight from a float32 matrix.
+        
+        The matrix is converted once, at the client boundary, instead of
+        building a ``PointStruct`` with its own list per vector.
+        """
+        try:
+            self.client.upsert(
+                collection_name=collection_name,
+                points=Batch(
+                    ids=ids,
+                    vectors=np.ascontiguousarray(vectors, dtype=np.float32).tolist(),
+                    payloads=payloads
+                )
+            )
+            logger.info(f"Upserted {len(ids)} points to {collection_name}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to upsert points to {collection_name}: {e}")
+            return False
+    
     def search(
         self, 
         collection_name: str, 
-        query_vector: List[float], 
+        query_vector: Union[np.ndarray, List[float]], 
         limit: int = 10,
         score_threshold: Optional[float] = None,
-        filter_conditions: Optional[Dict] = None
+        filter_conditions: Optional[Dict] = None,
+        rescore: Optional[bool] = None,
+        oversampling: Optional[float] = None,
+        hnsw_ef: Optional[int] = None,
+        exact: bool = False,
+        indexed_only: bool = False
     ) -> List[Dict[str, Any]]:
         try:
-            search_params = {
-                "collection_name": collection_name,
-                "query_vector": query_vector,
-                "limit": limit
-            }
-            
-            if score_threshold is not None:
-                search_params["score_threshold"] = score_threshold
-            
-            if filter_conditions is not None:
-                search_params["query_filter"] = filter_conditions
-            
-            results = self.client.search(**search_params)
-            
-            return [
-                {
-                    "id": result.id,
-                    "score": result.score,
-                    "payload": result.payload
-                }
-                for result in results
-            ]
+            results = self.client.search(**search_params(
+                collection_name, query_vector, limit, score_threshold, filter_conditions,
+                rescore, oversampling, hnsw_ef, exact, indexed_only
+            ))
+            return format_results(results)
         except Exception as e:
             logger.error(f"Search failed in {collection_name}: {e}")
             return []
     
+    def search_batch(
+        self, 
+        collection_name: str, 
+        requests: List[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """Run several searches in one request.
+        
+        Each request takes the keyword arguments of ``search`` (without the
+        collection name); results come back in request order.
+        """
+        try:
+            batch_results = self.client.search_batch(
+                collection_name=collection_name,
+                requests=[search_request(request) for request in requests]
+            )
+            return [format_results(results) for results in batch_results]
+        except Exception as e:
+            logger.error(f"Batch search failed in {collection_name}: {e}")
+            return [[] for _ in requests]
+    
     def scroll_collection(
         self, 
         collection_name: str, 
@@ -161,29 +555,43 @@ class QdrantManager:
             logger.error(f"Failed to scroll collection {collection_name}: {e}")
             return [], None
     
-    def get_all_points(self, collection_name: str) -> List[Dict[str, Any]]:
-        all_points = []
-        offset = None
+    def iter_points(
+        self, 
+        collection_name: str, 
+        batch_size: int = 1000,
+        with_payload: bool = True,
+        with_vectors: bool = False,
+        parallel: int = 1
+    ) -> Iterator[List[Record]]:
+        """Stream the whole collection, one page of points at a time.
         
-        while True:
-            points, next_offset = self.scroll_collection(
-                collection_name, 
-                limit=1000, 
-                offset=offset,
-                with_payload=True,
-                with_vectors=False
-            )
-            
-            if not points:
-                break
-            
+        Pages are yielded as they arrive, so consumers start right away and
+        only a few pages are held in memory. ``parallel`` > 1 reads disjoint
+        id ranges concurrently (see ``scroll_points``); page order is then
+        not id order.
+        """
+        return scroll_points(
+            self.client, collection_name, batch_size, with_payload, with_vectors, parallel
+        )
+    
+    def iter_payloads(
+        self, 
+        collection_name: str, 
+        batch_size: int = 1000,
+        parallel: int = 1
+    ) -> Iterator[Dict[str, Any]]:
+        count = 0
+        for points in self.iter_points(collection_name, batch_size, parallel=parallel):
             for point in points:
                 if point.payload:
-                    all_points.append(point.payload)
-            
-            offset = next_offset
-            if not offset:
-                break
+                    count += 1
+                    yield point.payload
         
-        logger.info(f"Retrieved {len(all_points)} points from {collection_name}")
-        return all_points
+        logger.info(f"Retrieved {count} points from {collection_name}")
+    
+    def get_all_points(self, collection_name: str, parallel: int = 1) -> List[Dict[str, Any]]:
+        try:
+            return list(self.iter_payloads(collection_name, parallel=parallel))
+        except Exception as e:
+            logger.error(f"Failed to scroll collection {collection_name}: {e}")
+            return []
@@ -0,0 +1,141 @@
+"""Streaming, range-parallel scans of a Qdrant collection."""
+
+import logging
+import queue
+import threading
+import uuid
+from typing import Iterator, List, Optional, Tuple, Union
+
+from qdrant_client import QdrantClient
+from qdrant_client.models import Record
+
+logger = logging.getLogger(__name__)
+
+PointId = Union[str, int]
+
+UUID_SPACE = 1 << 128
+
+
+def id_ranges(parallel: int) -> List[Tuple[Optional[str], Optional[str]]]:
+    """Split the point id space into ``parallel`` disjoint ``[start, end)`` ranges.
+
+    Qdrant scrolls in id order, integers before UUIDs, so the ranges cut the
+    UUID space into equal slices; the first range also covers integer ids.
+    ``None`` marks an open end.
+    """
+    bounds = [str(uuid.UUID(int=i * UUID_SPACE // parallel)) for i in range(1, parallel)]
+    return list(zip([None, *bounds], [*bounds, None]))
+
+
+def _id_key(point_id: PointId) -> Tuple[int, int]:
+    if isinstance(point_id, int):
+        return 0, point_id
+    return 1, uuid.UUID(str(point_id)).int
+
+
+def scroll_range(
+    client: QdrantClient,
+    collection_name: str,
+    start: Optional[PointId] = None,
+    end: Optional[PointId] = None,
+    batch_size: int = 1000,
+    with_payload: bool = True,
+    with_vectors: bool = False
+) -> Iterator[List[Record]]:
+    """Yield pages of points with ids in ``[start, end)``, in id order."""
+    end_key = _id_key(end) if end is not None else None
+    offset = start
+
+    while True:
+        points, next_offset = client.scroll(
+            collection_name=collection_name,
+            limit=batch_size,
+            offset=offset,
+            with_payload=with_payload,
+            with_vectors=with_vectors
+        )
+
+        if end_key is not None:
+            in_range = [point for point in points if _id_key(point.id) < end_key]
+            if len(in_range) < len(points):
+                next_offset = None
+            points = in_range
+
+        if points:
+            yield points
+
+        if next_offset is None or (end_key is not None and _id_key(next_offset) >= end_key):
+            return
+        offset = next_offset
+
+
+def scroll_points(
+    client: QdrantClient,
+    collection_name: str,
+    batch_size: int = 1000,
+    with_payload: bool = True,
+    with_vectors: bool = False,
+    parallel: int = 1
+) -> Iterator[List[Record]]:
+    """Yield pages of points as they are read.
+
+    With ``parallel`` > 1 the id space is split by ``id_ranges`` and each
+    range is scrolled by its own thread. Pages then arrive in no particular
+    order. A bounded queue keeps at most two pages per reader buffered, so
+    memory stays constant however large the collection is. Errors from a
+    reader are raised in the consumer.
+    """
+    if parallel <= 1:
+        yield from scroll_range(
+            client, collection_name, batch_size=batch_size,
+            with_payload=with_payload, with_vectors=with_vectors
+        )
+        return
+
+    pages: "queue.Queue" = queue.Queue(maxsize=2 * parallel)
+    stop = threading.Event()
+    done = object()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def read(start: Optional[str], end: Optional[str]) -> None:
+        try:
+            for page in scroll_range(
+                client, collection_name, start, end, batch_size, with_payload, with_vectors
+            ):
+                if not put(page):
+                    return
+        except Exception as e:
+            put(e)
+        finally:
+            put(done)
+
+    readers = [
+        threading.Thread(target=read, args=bounds, name=f"qdrant-scroll-{i}", daemon=True)
+        for i, bounds in enumerate(id_ranges(parallel))
+    ]
+    for reader in readers:
+        reader.start()
+
+    try:
+        remaining = len(readers)
+        while remaining:
+            item = pages.get()
+            if item is done:
+                remaining -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+    finally:
+        # Also reached when the consumer stops early; unblocks the readers
+        stop.set()
+        for reader in readers:
+            reader.join()
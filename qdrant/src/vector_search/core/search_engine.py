@@ -1,137 +1,461 @@
 """Main search engine combining Qdrant operations with embedding generation."""
 
 import logging
-from typing import List, Dict, Any, Optional, Union
+import threading
+import uuid
+from collections import deque
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Tuple, Union
+import numpy as np
 from tqdm import tqdm
 
 from .qdrant_client import QdrantManager
-from .embedders import CLIPEmbedder, OpenAIEmbedder, BaseEmbedder
+from .bulk_upload import BulkUploader
+from .embedders import AsyncOpenAIEmbedder, CLIPEmbedder, OpenAIEmbedder
+from .embedding_pool import CLIPEmbeddingPool
+from .filters import PAYLOAD_INDEXES, ProductFilter, as_filter
+from .image_fetcher import ImageFetcher
+from .image_store import ImageStore
+from .embedding_cache import EmbeddingCache
+from .query_cache import QueryEmbeddingCache
 
 logger = logging.getLogger(__name__)
 
+# Number of product texts handed to the embedder at once; the embedder packs
+# them into as few API requests as its token limits allow.
+TEXT_EMBEDDING_CHUNK_SIZE = 512
+
+# Text embedding backends: OpenAI's API, or the local CLIP text tower
+TEXT_BACKENDS = ("openai", "clip")
+
+
+def _describe_count(products: Iterable) -> str:
+    return str(len(products)) if hasattr(products, "__len__") else "streamed"
+
 
 class VectorSearchEngine:
     def __init__(
         self, 
         qdrant_url: str, 
         qdrant_api_key: Optional[str] = None,
-        openai_api_key: Optional[str] = None
+        qdrant_options: Optional[Dict[str, Any]] = None,
+        openai_api_key: Optional[str] = None,
+        image_fetch_workers: int = 16,
+        embedding_cache_dir: Optional[str] = None,
+        embedding_cache_max_bytes: int = 2 * 1024 ** 3,
+        query_cache_size: int = 1024,
+        query_cache_ttl: Optional[float] = None,
+        collection_metadata_ttl: Optional[float] = 60,
+        image_cache_dir: Optional[str] = None,
+        image_cache_max_bytes: int = 5 * 1024 ** 3,
+        offline: bool = False,
+        clip_inference_mode: str = "fp32",
+        clip_num_threads: Optional[int] = None,
+        clip_image_size: Optional[int] = None,
+        clip_towers: Optional[str] = None,
+        clip_model_name: str = "openai/clip-vit-large-patch14",
+        clip_model_path: Optional[str] = None,
+        openai_concurrent: bool = False,
+        openai_requests_per_minute: int = 3000,
+        openai_tokens_per_minute: int = 1_000_000,
+        openai_max_concurrency: int = 16,
+        upsert_parallel: int = 4,
+        upsert_batch_bytes: int = 4 * 1024 ** 2
     ):
-        self.qdrant = QdrantManager(qdrant_url, qdrant_api_key)
+        # Transport settings, see QdrantManager
+        self.qdrant = QdrantManager(qdrant_url, qdrant_api_key, **(qdrant_options or {}))
         
-        self.clip_embedder = CLIPEmbedder()
-        self.openai_embedder = OpenAIEmbedder(openai_api_key) if openai_api_key else None
+        self.embedding_cache = (
+            EmbeddingCache(embedding_cache_dir, embedding_cache_max_bytes)
+            if embedding_cache_dir else None
+        )
+        # Without clip_image_size the fetcher decodes to the loaded CLIP
+        # checkpoint's crop size, set once the embedder is built
+        self.image_fetcher = ImageFetcher(
+            max_workers=image_fetch_workers,
+            store=ImageStore(image_cache_dir, image_cache_max_bytes) if image_cache_dir else None,
+            offline=offline,
+            image_size=clip_image_size
+        )
+        self.query_cache = QueryEmbeddingCache(query_cache_size, query_cache_ttl)
+        self._upload_options = {"parallel": upsert_parallel, "batch_bytes": upsert_batch_bytes}
+        
+        # Embedders are built on first use: loading CLIP takes tens of seconds
+        # and most commands only need one of them, if any.
+        self._clip_options = {
+            "model_name": clip_model_name,
+            "image_fetcher": self.image_fetcher,
+            "cache": self.embedding_cache,
+            "inference_mode": clip_inference_mode,
+            "num_threads": clip_num_threads,
+            "model_path": clip_model_path
+        }
+        # None loads only the tower the first CLIP call needs
+        self._clip_towers = clip_towers
+        self._openai_api_key = openai_api_key
+        self._openai_options = {
+            "requests_per_minute": openai_requests_per_minute,
+            "tokens_per_minute": openai_tokens_per_minute,
+            "max_concurrency": openai_max_concurrency
+        } if openai_concurrent else None
+        self._clip_embedder: Optional[CLIPEmbedder] = None
+        self._openai_embedder: Optional[OpenAIEmbedder] = None
+        self._embedder_lock = threading.Lock()
+        # Recorded backend and tuned hnsw_ef per collection; entries expire so
+        # rebuilds and tune-ef runs by other processes are picked up
+        self.metadata_cache = QueryEmbeddingCache(ttl=collection_metadata_ttl)
         logger.info("Vector search engine initialized")
     
+    @property
+    def clip_embedder(self) -> CLIPEmbedder:
+        return self._get_clip_embedder(self._clip_towers or "both")
+    
+    @clip_embedder.setter
+    def clip_embedder(self, embedder: CLIPEmbedder) -> None:
+        self._clip_embedder = embedder
+        self._match_image_size(embedder)
+    
+    def _get_clip_embedder(self, tower: str) -> CLIPEmbedder:
+        if self._clip_embedder is None:
+            with self._embedder_lock:
+                if self._clip_embedder is None:
+                    embedder = CLIPEmbedder(towers=self._clip_towers or tower, **self._clip_options)
+                    self._match_image_size(embedder)
+                    self._clip_embedder = embedder
+        return self._clip_embedder
+    
+    def _match_image_size(self, embedder: CLIPEmbedder) -> None:
+        if self.image_fetcher.image_size is None:
+            self.image_fetcher.image_size = embedder.image_size
+    
+    @property
+    def openai_embedder(self) -> Optional[OpenAIEmbedder]:
+        if self._openai_embedder is None and self._openai_api_key:
+            with self._embedder_lock:
+                if self._openai_embedder is None and self._openai_options:
+                    self._openai_embedder = AsyncOpenAIEmbedder(
+                        self._openai_api_key, cache=self.embedding_cache, **self._openai_options
+                    )
+                elif self._openai_embedder is None:
+                    self._openai_embedder = OpenAIEmbedder(
+                        self._openai_api_key, cache=self.embedding_cache
+                    )
+        return self._openai_embedder
+    
+    @openai_embedder.setter
+    def openai_embedder(self, embedder: Optional[OpenAIEmbedder]) -> None:
+        self._openai_embedder = embedder
+    
+    def warmup(self, clip: bool = True, openai: bool = True) -> None:
+        """Construct embedders eagerly, e.g. before a server starts taking traffic."""
+        if clip:
+            self.clip_embedder
+        if openai:
+            self.openai_embedder
+    
+    def get_text_embedder(self, backend: str = "openai") -> Union[OpenAIEmbedder, CLIPEmbedder]:
+        if backend not in TEXT_BACKENDS:
+            raise ValueError(f"Unknown text backend '{backend}', expected one of {TEXT_BACKENDS}")
+        
+        if backend == "clip":
+            return self._get_clip_embedder("text")
+        if not self.openai_embedder:
+            raise ValueError("OpenAI API key required for text embeddings")
+        return self.openai_embedder
+    
+    def collection_metadata(self, collection_name: str) -> Dict[str, Any]:
+        """Stored metadata of a collection, cached for ``collection_metadata_ttl`` seconds."""
+        return self.metadata_cache.get_or_compute(
+            collection_name, lambda: self.qdrant.get_collection_metadata(collection_name)
+        )
+    
+    def cached_collection_metadata(self, collection_name: str) -> Optional[Dict[str, Any]]:
+        """Cached metadata of a collection, or None if it has to be looked up."""
+        return self.metadata_cache.get(collection_name)
+    
+    def cache_collection_metadata(self, collection_name: str, metadata: Dict[str, Any]) -> None:
+        """Cache metadata read elsewhere, e.g. by ``AsyncQdrantManager``."""
+        self.metadata_cache.put(collection_name, metadata)
+    
+    def set_collection_metadata(self, collection_name: str, metadata: Dict[str, Any]) -> bool:
+        """Merge ``metadata`` into the stored metadata and drop the cached copy."""
+        stored = self.qdrant.set_collection_metadata(collection_name, metadata)
+        self.invalidate_collection_metadata(collection_name)
+        return stored
+    
+    def invalidate_collection_metadata(self, collection_name: Optional[str] = None) -> None:
+        """Forget cached metadata of one collection, or of all of them."""
+        if collection_name is None:
+            self.metadata_cache.clear()
+        else:
+            self.metadata_cache.discard(collection_name)
+    
+    def collection_backend(self, collection_name: str) -> Optional[str]:
+        """Embedding backend a collection was built with, if it was recorded."""
+        return self.collection_metadata(collection_name).get("embedding_backend")
+    
+    def _record_backend(self, collection_name: str, backend: str, model: str) -> None:
+        self.set_collection_metadata(
+            collection_name, {"embedding_backend": backend, "embedding_model": model}
+        )
+    
+    def search_options(
+        self, 
+        collection_name: str, 
+        rescore: Optional[bool] = None,
+        oversampling: Optional[float] = None,
+        hnsw_ef: Optional[int] = None,
+        exact: bool = False,
+        indexed_only: bool = False,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Keyword arguments for ``QdrantManager.search`` on ``collection_name``.
+        
+        ``metadata`` is the collection's stored metadata if the caller already
+        read it; otherwise it's looked up (blocking once the cache expires).
+        """
+        # Without an explicit ef, use the one tune_hnsw_ef stored, if any
+        if hnsw_ef is None and not exact:
+            if metadata is None:
+                metadata = self.collection_metadata(collection_name)
+            hnsw_ef = metadata.get("hnsw_ef")
+        return {
+            "rescore": rescore,
+            "oversampling": oversampling,
+            "hnsw_ef": hnsw_ef,
+            "exact": exact,
+            "indexed_only": indexed_only
+        }
+    
+    def _resolve_text_backend(self, collection_name: str, backend: Optional[str]) -> str:
+        if backend is None:
+            return self.collection_backend(collection_name) or "openai"
+        self._check_backend(collection_name, backend)
+        return backend
+    
+    def _check_backend(self, collection_name: str, backend: str) -> None:
+        recorded = self.collection_backend(collection_name)
+        if recorded is not None and recorded != backend:
+            raise ValueError(
+                f"Collection {collection_name} was built with the {recorded} backend, "
+                f"cannot query it with {backend} embeddings"
+            )
+    
     def build_text_embeddings(
         self, 
-        products: List[Dict[str, Any]], 
+        products: Iterable[Dict[str, Any]], 
         collection_name: str = "ikea_products",
-        batch_size: int = 32
+        batch_size: int = 32,
+        backend: str = "openai"
     ) -> int:
-        if not self.openai_embedder:
-            raise ValueError("OpenAI API key required for text embeddings")
+        embedder = self.get_text_embedder(backend)
+        if backend == "clip":
+            embed = embedder.get_text_embeddings
+            self._record_backend(collection_name, backend, embedder.model_name)
+        else:
+            embed = embedder.get_embeddings
+            self._record_backend(collection_name, backend, embedder.model)
+        self.qdrant.create_payload_indexes(collection_name, PAYLOAD_INDEXES)
         
-        points = []
+        pending = []
         processed_count = 0
         failed_count = 0
-        
-        logger.info(f"Processing {len(products)} products for text embeddings...")
-        
-        for i, product in enumerate(tqdm(products, desc="Processing products")):
-            text = self._create_text_representation(product)
-            if not text.strip():
-                failed_count += 1
-                continue
-            
-            embedding = self.openai_embedder.get_embedding(text)
-            if not embedding:
-                failed_count += 1
-                continue
+        chunk_size = max(batch_size, TEXT_EMBEDDING_CHUNK_SIZE)
+        if isinstance(embedder, AsyncOpenAIEmbedder):
+            # Give the embedder enough texts to keep every request slot busy
+            chunk_size = max(chunk_size, embedder.max_concurrency * embedder.max_batch_items)
+        
+        logger.info(f"Processing {_describe_count(products)} products for text embeddings...")
+        
+        # Upserts run in the background while the next chunk is embedded
+        with self.qdrant.bulk_uploader(collection_name, **self._upload_options) as uploader:
+            for i, product in enumerate(tqdm(products, desc="Processing products")):
+                text = self._create_text_representation(product)
+                if not text.strip():
+                    failed_count += 1
+                    continue
+                
+                pending.append((product, text))
+                if len(pending) < chunk_size:
+                    continue
+                
+                processed, failed = self._embed_text_chunk(embed, pending, uploader)
+                processed_count += processed
+                failed_count += failed
+                pending = []
             
-            point = self._create_point(product, embedding, text)
-            points.append(point)
-            processed_count += 1
-            
-            if len(points) >= batch_size:
-                if self.qdrant.upsert_points(collection_name, points):
-                    points = []
-                else:
-                    points = []
-        
-        if points:
-            self.qdrant.upsert_points(collection_name, points)
+            if pending:
+                processed, failed = self._embed_text_chunk(embed, pending, uploader)
+                processed_count += processed
+                failed_count += failed
         
+        processed_count -= uploader.failed
+        failed_count += uploader.failed
         logger.info(f"Text embedding process completed: {processed_count} successful, {failed_count} failed")
         return processed_count
     
+    def _embed_text_chunk(
+        self, 
+        embed: Callable[[List[str]], Tuple[np.ndarray, List[bool]]],
+        pending: List[Tuple[Dict[str, Any], str]], 
+        uploader: BulkUploader
+    ) -> Tuple[int, int]:
+        embeddings, valid = embed([text for _, text in pending])
+        
+        payloads = [
+            self._create_payload(product, text)
+            for (product, text), ok in zip(pending, valid)
+            if ok
+        ]
+        if payloads:
+            self._upsert_vectors(uploader, embeddings[np.asarray(valid, dtype=bool)], payloads)
+        
+        return len(payloads), len(pending) - len(payloads)
+    
     def build_image_embeddings(
         self, 
-        products: List[Dict[str, Any]], 
+        products: Iterable[Dict[str, Any]], 
         collection_name: str = "furniture_images",
-        batch_size: int = 32
+        batch_size: int = 32,
+        num_workers: int = 0,
+        threads_per_worker: Optional[int] = None,
+        worker_start_method: Optional[str] = None
     ) -> int:
-        points = []
+        """Embed product images and upsert them in batches of ``batch_size``.
+        
+        ``products`` may be any iterable, e.g. a stream from
+        ``QdrantManager.iter_payloads``; it is consumed lazily, so embedding
+        starts with the first product.
+        
+        With ``num_workers`` > 1 the forward passes run on a
+        ``CLIPEmbeddingPool`` of that many processes, started with
+        ``worker_start_method`` (see ``CLIPEmbeddingPool``).
+        """
         processed_count = 0
         failed_count = 0
         
-        logger.info(f"Processing {len(products)} products for image embeddings...")
-        
-        for i, product in enumerate(tqdm(products, desc="Processing products")):
-            image_url = product.get("main_image_url")
-            if not image_url:
-                logger.warning(f"Product {product.get('product_id', 'unknown')} has no image URL")
-                failed_count += 1
-                continue
-            
-            if image_url.endswith('?f=xxs'):
-                image_url = image_url[:-6]
-            
-            embedding = self.clip_embedder.get_image_embedding(image_url)
-            if not embedding:
-                failed_count += 1
-                continue
-            
-            point = self._create_point(
-                product, 
-                embedding, 
-                text=None,
-                additional_payload={"clip_image_url": image_url}
+        logger.info(f"Processing {_describe_count(products)} products for image embeddings...")
+        
+        def iter_candidates() -> Iterator[Tuple[Dict[str, Any], str]]:
+            nonlocal failed_count
+            for product in products:
+                image_url = product.get("main_image_url")
+                if not image_url:
+                    logger.warning(f"Product {product.get('product_id', 'unknown')} has no image URL")
+                    failed_count += 1
+                    continue
+                
+                if image_url.endswith('?f=xxs'):
+                    image_url = image_url[:-6]
+                
+                yield product, image_url
+        
+        batches = self._iter_image_batches(iter_candidates(), batch_size)
+        clip_embedder = self._get_clip_embedder("vision")
+        self._record_backend(collection_name, "clip", clip_embedder.model_name)
+        self.qdrant.create_payload_indexes(collection_name, PAYLOAD_INDEXES)
+        pool = None
+        
+        if num_workers > 1:
+            pool = CLIPEmbeddingPool(
+                clip_embedder, num_workers, threads_per_worker, start_method=worker_start_method
+            )
+            results = pool.map_image_batches(
+                (pending, [image for _, _, image in pending]) for pending in batches
+            )
+        else:
+            results = (
+                (pending, *clip_embedder.get_image_embeddings([image for _, _, image in pending]))
+                for pending in batches
             )
-            points.append(point)
-            processed_count += 1
-            
-            if len(points) >= batch_size:
-                if self.qdrant.upsert_points(collection_name, points):
-                    points = []
-                else:
-                    points = []
         
-        if points:
-            self.qdrant.upsert_points(collection_name, points)
+        uploader = self.qdrant.bulk_uploader(collection_name, **self._upload_options)
+        try:
+            for pending, embeddings, valid in results:
+                payloads = [
+                    self._create_payload(product, additional_payload={"clip_image_url": image_url})
+                    for (product, image_url, _), ok in zip(pending, valid)
+                    if ok
+                ]
+                processed_count += len(payloads)
+                failed_count += len(pending) - len(payloads)
+                if payloads:
+                    self._upsert_vectors(
+                        uploader, embeddings[np.asarray(valid, dtype=bool)], payloads
+                    )
+        finally:
+            uploader.close()
+            if pool is not None:
+                pool.close()
+        
+        processed_count -= uploader.failed
+        failed_count += uploader.failed
         
         logger.info(f"Image embedding process completed: {processed_count} successful, {failed_count} failed")
         return processed_count
     
+    def _iter_image_batches(
+        self, 
+        candidates: Iterable[Tuple[Dict[str, Any], str]], 
+        batch_size: int
+    ) -> Iterator[List[Tuple[Dict[str, Any], str, Any]]]:
+        # Downloads run ahead on the fetcher's pool while batches are embedded.
+        # Failed downloads stay in the batch as None and come back invalid.
+        # The fetcher pulls URLs ahead of the images it yields, and returns
+        # them in order, so candidates queue up here until their image arrives.
+        queued = deque()
+        
+        def iter_urls() -> Iterator[str]:
+            for product, image_url in candidates:
+                queued.append((product, image_url))
+                yield image_url
+        
+        images = self.image_fetcher.fetch_many(iter_urls(), prefetch=2 * batch_size)
+        
+        pending = []
+        for image in tqdm(images, desc="Processing products"):
+            product, image_url = queued.popleft()
+            pending.append((product, image_url, image))
+            if len(pending) >= batch_size:
+                yield pending
+                pending = []
+        
+        if pending:
+            yield pending
+    
     def search_by_text(
         self, 
         query_text: str, 
         collection_name: str,
         limit: int = 10,
         score_threshold: float = 0.7,
-        use_clip: bool = False
+        use_clip: bool = False,
+        backend: Optional[str] = None,
+        rescore: Optional[bool] = None,
+        oversampling: Optional[float] = None,
+        hnsw_ef: Optional[int] = None,
+        exact: bool = False,
+        indexed_only: bool = False,
+        filters: Optional[ProductFilter] = None
     ) -> List[Dict[str, Any]]:
-        embedder = self.clip_embedder if use_clip else self.openai_embedder
-        
-        if not embedder:
-            raise ValueError(f"Embedder not available for {'CLIP' if use_clip else 'OpenAI'} search")
-        
-        if use_clip:
-            query_embedding = embedder.get_text_embedding(query_text)
-        else:
-            query_embedding = embedder.get_embedding(query_text)
+        """Search with a text query.
+        
+        ``backend`` defaults to the one recorded for the collection ("openai"
+        for collections built before it was recorded); ``use_clip`` is
+        shorthand for ``backend="clip"``. Raises ``ValueError`` if the backend
+        differs from the one the collection was built with.
+        
+        ``rescore`` to ``indexed_only`` are Qdrant search parameters (see
+        ``search_params``). ``hnsw_ef`` defaults to the value stored by
+        ``tune_hnsw_ef`` for the collection.
+        
+        ``filters`` restricts results to matching products, e.g.
+        ``ProductFilter(category="Sofas", max_price=500)``.
+        """
+        query_embedding = self.embed_text_query(
+            query_text, collection_name, "clip" if use_clip else backend
+        )
         
-        if not query_embedding:
+        if query_embedding is None:
             logger.error("Failed to generate query embedding")
             return []
         
@@ -139,21 +463,177 @@ class VectorSearchEngine:
             collection_name=collection_name,
             query_vector=query_embedding,
             limit=limit,
-            score_threshold=score_threshold
+            score_threshold=score_threshold,
+            filter_conditions=as_filter(filters),
+            **self.search_options(
+                collection_name, rescore, oversampling, hnsw_ef, exact, indexed_only
+            )
         )
         
-        return self._format_search_results(results)
+        return self.format_search_results(results)
+    
+    def embed_text_query(
+        self, 
+        query_text: str, 
+        collection_name: str, 
+        backend: Optional[str] = None
+    ) -> Optional[np.ndarray]:
+        """Query vector for searching ``collection_name``, through the query cache."""
+        backend = self._resolve_text_backend(collection_name, backend)
+        embedder = self.get_text_embedder(backend)
+        
+        if backend == "clip":
+            return self.query_cache.get_or_compute(
+                ("clip", embedder.model_name, "text", query_text),
+                lambda: embedder.get_text_embedding(query_text)
+            )
+        return self.query_cache.get_or_compute(
+            ("openai", embedder.model, "text", query_text),
+            lambda: embedder.get_embedding(query_text)
+        )
+    
+    def embed_image_query(self, query_image_url: str, collection_name: str) -> Optional[np.ndarray]:
+        self._check_backend(collection_name, "clip")
+        embedder = self._get_clip_embedder("vision")
+        return self.query_cache.get_or_compute(
+            ("clip", embedder.model_name, "image", query_image_url),
+            lambda: embedder.get_image_embedding(query_image_url)
+        )
+    
+    def search_many(
+        self, 
+        queries: List[Dict[str, Any]], 
+        collection_name: str,
+        limit: int = 10,
+        score_threshold: float = 0.7,
+        backend: Optional[str] = None,
+        rescore: Optional[bool] = None,
+        oversampling: Optional[float] = None,
+        hnsw_ef: Optional[int] = None,
+        exact: bool = False,
+        indexed_only: bool = False
+    ) -> List[List[Dict[str, Any]]]:
+        """Run many searches with one embedding batch per modality and one Qdrant request.
+        
+        Each query is a dict with either ``text`` or ``image_url`` and
+        optionally its own ``limit``, ``score_threshold`` and ``filter`` (a
+        ``ProductFilter`` or a raw Qdrant filter).
+        Returns one result list per query, in order; queries that could not
+        be embedded get an empty list.
+        """
+        vectors = self.embed_queries(queries, collection_name, backend)
+        positions, requests = self.batch_search_requests(
+            queries, vectors, limit, score_threshold,
+            self.search_options(collection_name, rescore, oversampling, hnsw_ef, exact, indexed_only)
+        )
+        
+        results: List[List[Dict[str, Any]]] = [[] for _ in queries]
+        if requests:
+            for i, hits in zip(positions, self.qdrant.search_batch(collection_name, requests)):
+                results[i] = self.format_search_results(hits)
+        return results
+    
+    def embed_queries(
+        self, 
+        queries: List[Dict[str, Any]], 
+        collection_name: str, 
+        backend: Optional[str] = None
+    ) -> List[Optional[np.ndarray]]:
+        """Query vectors for ``search_many``-style queries; None where embedding failed."""
+        vectors: List[Optional[np.ndarray]] = [None] * len(queries)
+        text_indices = [i for i, query in enumerate(queries) if "text" in query]
+        image_indices = [i for i, query in enumerate(queries) if "image_url" in query]
+        
+        if len(text_indices) + len(image_indices) != len(queries):
+            raise ValueError("Each query needs either 'text' or 'image_url'")
+        
+        if text_indices:
+            backend = self._resolve_text_backend(collection_name, backend)
+            embedder = self.get_text_embedder(backend)
+            if backend == "clip":
+                key, embed = ("clip", embedder.model_name, "text"), embedder.get_text_embeddings
+            else:
+                key, embed = ("openai", embedder.model, "text"), embedder.get_embeddings
+            texts = [queries[i]["text"] for i in text_indices]
+            for i, vector in zip(text_indices, self._embed_cached(key, texts, embed)):
+                vectors[i] = vector
+        
+        if image_indices:
+            self._check_backend(collection_name, "clip")
+            embedder = self._get_clip_embedder("vision")
+            urls = [queries[i]["image_url"] for i in image_indices]
+            embedded = self._embed_cached(
+                ("clip", embedder.model_name, "image"), urls, embedder.get_image_embeddings
+            )
+            for i, vector in zip(image_indices, embedded):
+                vectors[i] = vector
+        
+        return vectors
+    
+    def batch_search_requests(
+        self, 
+        queries: List[Dict[str, Any]], 
+        vectors: List[Optional[np.ndarray]], 
+        limit: int, 
+        score_threshold: float,
+        search_options: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[int], List[Dict[str, Any]]]:
+        """Search requests for the queries that have a vector, and their positions."""
+        requests = []
+        positions = []
+        for i, (query, vector) in enumerate(zip(queries, vectors)):
+            if vector is None:
+                logger.error(f"Failed to generate query embedding for query {i}")
+                continue
+            positions.append(i)
+            requests.append({
+                "query_vector": vector,
+                "limit": query.get("limit", limit),
+                "score_threshold": query.get("score_threshold", score_threshold),
+                "filter_conditions": as_filter(query.get("filter")),
+                **(search_options or {})
+            })
+        return positions, requests
+    
+    def _embed_cached(
+        self, 
+        key: Tuple[str, ...], 
+        inputs: List[str], 
+        embed: Callable[[List[str]], Tuple[np.ndarray, List[bool]]]
+    ) -> List[Optional[np.ndarray]]:
+        # Cached queries are reused; the rest are embedded in one call
+        vectors = [self.query_cache.get((*key, item)) for item in inputs]
+        misses = [j for j, vector in enumerate(vectors) if vector is None]
+        
+        if misses:
+            unique = list(dict.fromkeys(inputs[j] for j in misses))
+            embeddings, valid = embed(unique)
+            fresh = {}
+            for item, row, ok in zip(unique, embeddings, valid):
+                if ok:
+                    fresh[item] = row.copy()
+                    self.query_cache.put((*key, item), fresh[item])
+            for j in misses:
+                vectors[j] = fresh.get(inputs[j])
+        
+        return vectors
     
     def search_by_image(
         self, 
         query_image_url: str, 
         collection_name: str,
         limit: int = 10,
-        score_threshold: float = 0.7
+        score_threshold: float = 0.7,
+        rescore: Optional[bool] = None,
+        oversampling: Optional[float] = None,
+        hnsw_ef: Optional[int] = None,
+        exact: bool = False,
+        indexed_only: bool = False,
+        filters: Optional[ProductFilter] = None
     ) -> List[Dict[str, Any]]:
-        query_embedding = self.clip_embedder.get_image_embedding(query_image_url)
+        query_embedding = self.embed_image_query(query_image_url, collection_name)
         
-        if not query_embedding:
+        if query_embedding is None:
             logger.error("Failed to generate query embedding")
             return []
         
@@ -161,10 +641,14 @@ class VectorSearchEngine:
             collection_name=collection_name,
             query_vector=query_embedding,
             limit=limit,
-            score_threshold=score_threshold
+            score_threshold=score_threshold,
+            filter_conditions=as_filter(filters),
+            **self.search_options(
+                collection_name, rescore, oversampling, hnsw_ef, exact, indexed_only
+            )
         )
         
-        return self._format_search_results(results)
+        return self.format_search_results(results)
     
     def _create_text_representation(self, product: Dict[str, Any]) -> str:
         text_parts = []
@@ -193,15 +677,12 @@ class VectorSearchEngine:
         
         return " ".join(text_parts)
     
-    def _create_point(
+    def _create_payload(
         self, 
         product: Dict[str, Any], 
-        embedding: List[float], 
         text: Optional[str] = None,
         additional_payload: Optional[Dict] = None
-    ) -> Any:
-        from qdrant_client.models import PointStruct
-        
+    ) -> Dict[str, Any]:
         payload = {
             'product_id': product.get('product_id'),
             'product_number': product.get('product_number'),
@@ -225,17 +706,20 @@ class VectorSearchEngine:
         if additional_payload:
             payload.update(additional_payload)
         
-        # Generate a valid UUID for Qdrant
-        import uuid
-        point_id = str(uuid.uuid4())
-        
-        return PointStruct(
-            id=point_id,
-            vector=embedding,
-            payload=payload
-        )
+        return payload
+    
+    def _upsert_vectors(
+        self, 
+        uploader: BulkUploader, 
+        vectors: np.ndarray, 
+        payloads: List[Dict[str, Any]]
+    ) -> None:
+        # Generate valid UUIDs for Qdrant
+        ids = [str(uuid.uuid4()) for _ in payloads]
+        uploader.add(ids, vectors, payloads)
     
-    def _format_search_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def format_search_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Product fields and score of each result; results without a payload are dropped."""
         formatted_results = []
         
         for result in results:
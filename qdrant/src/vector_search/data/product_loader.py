@@ -2,7 +2,7 @@
 
 import json
 import logging
-from typing import List, Dict, Any, Optional
+from typing import Iterable, Iterator, List, Dict, Any, Optional
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -59,6 +59,31 @@ class ProductLoader:
             logger.error(f"Failed to load products from Qdrant: {e}")
             return []
     
+    @staticmethod
+    def iter_from_qdrant(
+        qdrant_manager, 
+        collection_name: str, 
+        batch_size: int = 1000,
+        parallel: int = 1
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream product payloads while the collection is being scrolled.
+        
+        Unlike ``load_from_qdrant`` nothing is collected up front; read errors
+        are raised to the consumer.
+        """
+        logger.info(f"Streaming products from Qdrant collection: {collection_name}")
+        return qdrant_manager.iter_payloads(collection_name, batch_size, parallel)
+    
+    @staticmethod
+    def iter_products_with_images(products: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Lazy ``filter_products_with_images`` followed by ``clean_image_urls``."""
+        for product in products:
+            image_url = product.get('main_image_url')
+            if image_url and image_url.startswith(('http://', 'https://')):
+                if image_url.endswith('?f=xxs'):
+                    product = {**product, 'main_image_url': image_url[:-6]}
+                yield product
+    
     @staticmethod
     def filter_products_with_images(products: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         filtered = []
@@ -1,39 +1,149 @@
 """Configuration management for the vector search engine."""
 
 import os
-from typing import Optional
-from dotenv import load_dotenv
-
-load_dotenv()
+from typing import Any, Dict, Optional
 
 
 class Config:
+    """Settings read from environment variables.
+
+    Values reflect the process environment at import time. ``load()`` applies
+    a ``.env`` file and refreshes them; entry points call it on startup so
+    that importing the package stays free of file-system lookups.
+    """
+    
     # Qdrant settings
-    QDRANT_URL: str = os.getenv("QDRANT_URL", "http://localhost:6333")
-    QDRANT_API_KEY: Optional[str] = os.getenv("QDRANT_API_KEY")
+    QDRANT_URL: str
+    QDRANT_API_KEY: Optional[str]
+    QDRANT_PREFER_GRPC: bool
+    QDRANT_GRPC_PORT: int
+    QDRANT_TIMEOUT: int
+    QDRANT_HTTP2: bool
+    QDRANT_POOL_SIZE: int
     
     # OpenAI settings
-    OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
-    OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "text-embedding-3-small")
+    OPENAI_API_KEY: Optional[str]
+    OPENAI_MODEL: str
+    OPENAI_REQUESTS_PER_MINUTE: int
+    OPENAI_TOKENS_PER_MINUTE: int
+    OPENAI_MAX_CONCURRENCY: int
     
     # CLIP settings
-    CLIP_MODEL: str = os.getenv("CLIP_MODEL", "openai/clip-vit-large-patch14")
+    CLIP_MODEL: str
+    CLIP_MODEL_PATH: str
+    CLIP_INFERENCE_MODE: str
+    CLIP_NUM_THREADS: int
+    CLIP_NUM_WORKERS: int
+    CLIP_WORKER_START_METHOD: str
+    CLIP_TOWERS: str
     
     # Collection names
-    TEXT_COLLECTION: str = os.getenv("TEXT_COLLECTION", "ikea_products")
-    IMAGE_COLLECTION: str = os.getenv("IMAGE_COLLECTION", "furniture_images")
+    TEXT_COLLECTION: str
+    IMAGE_COLLECTION: str
     
     # Processing settings
-    BATCH_SIZE: int = int(os.getenv("BATCH_SIZE", "32"))
-    VECTOR_SIZE_TEXT: int = int(os.getenv("VECTOR_SIZE_TEXT", "1536"))
-    VECTOR_SIZE_IMAGE: int = int(os.getenv("VECTOR_SIZE_IMAGE", "768"))
+    BATCH_SIZE: int
+    UPSERT_PARALLEL: int
+    UPSERT_BATCH_BYTES: int
+    INDEX_TIMEOUT: float
+    VECTOR_SIZE_TEXT: int
+    VECTOR_SIZE_IMAGE: int
+    
+    # Embedding cache settings (set EMBEDDING_CACHE_DIR to an empty string to disable)
+    EMBEDDING_CACHE_DIR: str
+    EMBEDDING_CACHE_MAX_BYTES: int
+    
+    # Raw image cache settings (set IMAGE_CACHE_DIR to an empty string to disable)
+    IMAGE_CACHE_DIR: str
+    IMAGE_CACHE_MAX_BYTES: int
+    IMAGE_CACHE_OFFLINE: bool
     
     # Search settings
-    DEFAULT_LIMIT: int = int(os.getenv("DEFAULT_LIMIT", "10"))
-    DEFAULT_THRESHOLD: float = float(os.getenv("DEFAULT_THRESHOLD", "0.7"))
+    DEFAULT_LIMIT: int
+    DEFAULT_THRESHOLD: float
+    
+    _loaded: bool = False
+    
+    @classmethod
+    def load(cls, dotenv_path: Optional[str] = None) -> None:
+        from dotenv import load_dotenv
+        
+        load_dotenv(dotenv_path)
+        cls._read_env()
+        cls._loaded = True
+    
+    @classmethod
+    def _read_env(cls) -> None:
+        # Qdrant settings
+        cls.QDRANT_URL = os.getenv("QDRANT_URL", "http://localhost:6333")
+        cls.QDRANT_API_KEY = os.getenv("QDRANT_API_KEY")
+        cls.QDRANT_PREFER_GRPC = os.getenv("QDRANT_PREFER_GRPC", "false").lower() in ("1", "true", "yes")
+        cls.QDRANT_GRPC_PORT = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+        cls.QDRANT_TIMEOUT = int(os.getenv("QDRANT_TIMEOUT", "0"))
+        cls.QDRANT_HTTP2 = os.getenv("QDRANT_HTTP2", "false").lower() in ("1", "true", "yes")
+        cls.QDRANT_POOL_SIZE = int(os.getenv("QDRANT_POOL_SIZE", "0"))
+        
+        # OpenAI settings
+        cls.OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+        cls.OPENAI_MODEL = os.getenv("OPENAI_MODEL", "text-embedding-3-small")
+        cls.OPENAI_REQUESTS_PER_MINUTE = int(os.getenv("OPENAI_REQUESTS_PER_MINUTE", "3000"))
+        cls.OPENAI_TOKENS_PER_MINUTE = int(os.getenv("OPENAI_TOKENS_PER_MINUTE", "1000000"))
+        cls.OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "16"))
+        
+        # CLIP settings
+        cls.CLIP_MODEL = os.getenv("CLIP_MODEL", "openai/clip-vit-large-patch14")
+        # Local snapshot of CLIP_MODEL; loaded offline with memory-mapped weights
+        cls.CLIP_MODEL_PATH = os.getenv("CLIP_MODEL_PATH", "")
+        cls.CLIP_INFERENCE_MODE = os.getenv("CLIP_INFERENCE_MODE", "fp32")
+        cls.CLIP_NUM_THREADS = int(os.getenv("CLIP_NUM_THREADS", "0"))
+        cls.CLIP_NUM_WORKERS = int(os.getenv("CLIP_NUM_WORKERS", "0"))
+        # "forkserver", "spawn" or "fork"; empty picks forkserver where available
+        cls.CLIP_WORKER_START_METHOD = os.getenv("CLIP_WORKER_START_METHOD", "")
+        # "vision", "text" or "both"; empty loads whichever tower is used first
+        cls.CLIP_TOWERS = os.getenv("CLIP_TOWERS", "")
+        
+        # Collection names
+        cls.TEXT_COLLECTION = os.getenv("TEXT_COLLECTION", "ikea_products")
+        cls.IMAGE_COLLECTION = os.getenv("IMAGE_COLLECTION", "furniture_images")
+        
+        # Processing settings
+        cls.BATCH_SIZE = int(os.getenv("BATCH_SIZE", "32"))
+        cls.UPSERT_PARALLEL = int(os.getenv("UPSERT_PARALLEL", "4"))
+        cls.UPSERT_BATCH_BYTES = int(os.getenv("UPSERT_BATCH_BYTES", str(4 * 1024 ** 2)))
+        # Seconds a --bulk-load build waits for the collection to be indexed
+        cls.INDEX_TIMEOUT = float(os.getenv("INDEX_TIMEOUT", "3600"))
+        cls.VECTOR_SIZE_TEXT = int(os.getenv("VECTOR_SIZE_TEXT", "1536"))
+        cls.VECTOR_SIZE_IMAGE = int(os.getenv("VECTOR_SIZE_IMAGE", "768"))
+        
+        # Embedding cache settings (set EMBEDDING_CACHE_DIR to an empty string to disable)
+        cls.EMBEDDING_CACHE_DIR = os.getenv("EMBEDDING_CACHE_DIR", "~/.cache/vector_search/embeddings")
+        cls.EMBEDDING_CACHE_MAX_BYTES = int(os.getenv("EMBEDDING_CACHE_MAX_BYTES", str(2 * 1024 ** 3)))
+        
+        # Raw image cache settings (set IMAGE_CACHE_DIR to an empty string to disable)
+        cls.IMAGE_CACHE_DIR = os.getenv("IMAGE_CACHE_DIR", "~/.cache/vector_search/images")
+        cls.IMAGE_CACHE_MAX_BYTES = int(os.getenv("IMAGE_CACHE_MAX_BYTES", str(5 * 1024 ** 3)))
+        cls.IMAGE_CACHE_OFFLINE = os.getenv("IMAGE_CACHE_OFFLINE", "false").lower() in ("1", "true", "yes")
+        
+        # Search settings
+        cls.DEFAULT_LIMIT = int(os.getenv("DEFAULT_LIMIT", "10"))
+        cls.DEFAULT_THRESHOLD = float(os.getenv("DEFAULT_THRESHOLD", "0.7"))
+    
+    @classmethod
+    def qdrant_options(cls) -> Dict[str, Any]:
+        """Transport settings for ``QdrantManager``; 0 keeps the client default."""
+        return {
+            "prefer_grpc": cls.QDRANT_PREFER_GRPC,
+            "grpc_port": cls.QDRANT_GRPC_PORT,
+            "timeout": cls.QDRANT_TIMEOUT or None,
+            "http2": cls.QDRANT_HTTP2,
+            "pool_size": cls.QDRANT_POOL_SIZE or None
+        }
     
     @classmethod
     def validate(cls) -> bool:
+        if not cls._loaded:
+            cls.load()
+        
         required_vars = ["QDRANT_URL"]
         missing = [var for var in required_vars if not getattr(cls, var)]
         
@@ -41,3 +151,6 @@ class Config:
             raise ValueError(f"Missing required environment variables: {missing}")
         
         return True
+
+
+Config._read_env()
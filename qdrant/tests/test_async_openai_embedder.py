@@ -0,0 +1,124 @@
+import base64
+import json
+import threading
+
+import numpy as np
+
+from conftest import QuietHandler
+from vector_search.core.embedders import AsyncOpenAIEmbedder, OpenAIEmbedder
+
+
+def embedding_of(text: str) -> np.ndarray:
+    return np.full(4, len(text), dtype=np.float32)
+
+
+def embeddings_response(texts) -> bytes:
+    return json.dumps({
+        "object": "list",
+        "data": [
+            {
+                "object": "embedding",
+                "index": i,
+                "embedding": base64.b64encode(embedding_of(text).tobytes()).decode()
+            }
+            for i, text in enumerate(texts)
+        ],
+        "model": "text-embedding-3-small",
+        "usage": {"prompt_tokens": len(texts), "total_tokens": len(texts)}
+    }).encode()
+
+
+def error_response(message: str) -> bytes:
+    return json.dumps({"error": {"message": message, "type": "invalid_request_error"}}).encode()
+
+
+def make_embedder(base_url: str, **options) -> AsyncOpenAIEmbedder:
+    return AsyncOpenAIEmbedder("test-key", base_url=f"{base_url}/v1", **options)
+
+
+def test_rate_limited_requests_are_retried_after_retry_after(serve):
+    requests = []
+    lock = threading.Lock()
+
+    class Handler(QuietHandler):
+        def do_POST(self):
+            texts = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["input"]
+            with lock:
+                requests.append(texts)
+                first = len(requests) == 1
+            if first:
+                self.send_body(429, error_response("rate limited"), "application/json", Retry_After="0.2")
+            else:
+                self.send_body(200, embeddings_response(texts), "application/json")
+
+    embedder = make_embedder(serve(Handler))
+    texts = ["a", "bb", "ccc"]
+    embeddings, valid = embedder.get_embeddings(texts)
+
+    assert valid == [True, True, True]
+    np.testing.assert_array_equal(embeddings, np.stack([embedding_of(text) for text in texts]))
+    assert requests == [texts, texts]
+    assert embedder.last_run_stats["rate_limited"] == 1
+    assert embedder.last_run_stats["retries"] == 1
+    assert embedder.last_run_stats["seconds"] >= 0.2
+
+
+def test_retries_count_only_attempts_that_were_made(serve):
+    class Handler(QuietHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            self.send_body(429, error_response("rate limited"), "application/json", Retry_After="0")
+
+    embedder = make_embedder(serve(Handler), max_retries=2)
+    embeddings, valid = embedder.get_embeddings(["sofa"])
+
+    assert valid == [False]
+    assert embedder.last_run_stats["requests"] == 3
+    assert embedder.last_run_stats["rate_limited"] == 3
+    assert embedder.last_run_stats["retries"] == 2
+
+
+def test_sync_embedder_waits_out_rate_limits(serve, monkeypatch):
+    import openai
+
+    requests = []
+
+    class Handler(QuietHandler):
+        def do_POST(self):
+            texts = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["input"]
+            requests.append(texts)
+            if len(requests) == 1:
+                self.send_body(429, error_response("rate limited"), "application/json", Retry_After="0.2")
+            else:
+                self.send_body(200, embeddings_response(texts), "application/json")
+
+    # Leave retrying to the embedder rather than the SDK
+    monkeypatch.setattr(openai, "api_key", openai.api_key)
+    monkeypatch.setattr(openai, "base_url", f"{serve(Handler)}/v1")
+    monkeypatch.setattr(openai, "max_retries", 0)
+    embedder = OpenAIEmbedder("test-key")
+    texts = ["a", "bb", "ccc"]
+    embeddings, valid = embedder.get_embeddings(texts)
+
+    assert valid == [True, True, True]
+    np.testing.assert_array_equal(embeddings, np.stack([embedding_of(text) for text in texts]))
+    assert requests == [texts, texts]
+
+
+def test_rejected_input_does_not_fail_the_rest_of_its_batch(serve):
+    class Handler(QuietHandler):
+        def do_POST(self):
+            texts = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["input"]
+            if "bad input" in texts:
+                self.send_body(400, error_response("invalid input"), "application/json")
+            else:
+                self.send_body(200, embeddings_response(texts), "application/json")
+
+    embedder = make_embedder(serve(Handler))
+    texts = ["sofa", "bad input", "armchair", "lamp"]
+    embeddings, valid = embedder.get_embeddings(texts)
+
+    assert valid == [True, False, True, True]
+    for i in (0, 2, 3):
+        np.testing.assert_array_equal(embeddings[i], embedding_of(texts[i]))
+    assert embedder.last_run_stats["failed"] == 1
@@ -0,0 +1,37 @@
+import multiprocessing
+
+import numpy as np
+
+from vector_search.core.embedding_cache import EmbeddingCache
+
+
+def fill(path: str, tag: str) -> None:
+    cache = EmbeddingCache(path)
+    for batch in range(20):
+        cache.put_many("model", {
+            f"{tag}-{batch}-{i}": np.full(8, ord(tag) * 1000 + batch * 50 + i, dtype=np.float32)
+            for i in range(50)
+        })
+    cache.close()
+
+
+def test_processes_sharing_a_cache_never_share_a_slot(tmp_path):
+    path = str(tmp_path)
+    reader = EmbeddingCache(path)
+    reader.put_many("model", {"seed": np.ones(8, dtype=np.float32)})
+
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=fill, args=(path, tag)) for tag in "abc"]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+        assert worker.exitcode == 0
+
+    # The reader mapped the file before the workers grew it
+    keys = {
+        f"{tag}-{batch}-{i}": ord(tag) * 1000 + batch * 50 + i
+        for tag in "abc" for batch in range(20) for i in range(50)
+    }
+    found = reader.get_many("model", keys)
+    assert {key: float(vector[0]) for key, vector in found.items()} == keys
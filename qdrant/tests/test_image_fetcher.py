@@ -0,0 +1,96 @@
+import io
+import threading
+import time
+
+import requests
+from PIL import Image
+
+from conftest import QuietHandler
+from vector_search.core.image_fetcher import ImageFetcher
+from vector_search.core.image_store import ImageStore
+
+COLORS = ["red", "green", "blue", "yellow", "purple", "orange", "white", "black"]
+
+
+def png(color: str) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (16, 16), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_fetch_many_downloads_concurrently_in_order(serve):
+    active = [0]
+    peak = [0]
+    lock = threading.Lock()
+
+    class Handler(QuietHandler):
+        def do_GET(self):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.2)
+            with lock:
+                active[0] -= 1
+            self.send_body(200, png(self.path.strip("/")), "image/png")
+
+    base_url = serve(Handler)
+    fetcher = ImageFetcher(max_workers=8, session=requests.Session())
+    start = time.perf_counter()
+    images = list(fetcher.fetch_many(f"{base_url}/{color}" for color in COLORS))
+    elapsed = time.perf_counter() - start
+    fetcher.close()
+
+    expected = [Image.new("RGB", (1, 1), color).getpixel((0, 0)) for color in COLORS]
+    assert [image.getpixel((0, 0)) for image in images] == expected
+    assert peak[0] > 1
+    assert elapsed < 0.2 * len(COLORS) / 2
+
+
+def test_bad_urls_yield_none_without_stopping_the_rest(serve):
+    class Handler(QuietHandler):
+        def do_GET(self):
+            if self.path == "/missing":
+                self.send_body(404, b"not found", "text/plain")
+            elif self.path == "/garbage":
+                self.send_body(200, b"not an image", "image/png")
+            else:
+                self.send_body(200, png("red"), "image/png")
+
+    base_url = serve(Handler)
+    fetcher = ImageFetcher(max_workers=4, session=requests.Session())
+    urls = [
+        f"{base_url}/ok",
+        f"{base_url}/missing",
+        f"{base_url}/garbage",
+        "http://127.0.0.1:1/unreachable",
+        f"{base_url}/ok-again"
+    ]
+    images = list(fetcher.fetch_many(urls))
+    fetcher.close()
+
+    assert [image is not None for image in images] == [True, False, False, False, True]
+
+
+def test_stored_images_are_revalidated_with_etag(serve, tmp_path):
+    requests_seen = []
+    body = png("blue")
+
+    class Handler(QuietHandler):
+        def do_GET(self):
+            requests_seen.append(self.headers.get("If-None-Match"))
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.send_header("ETag", '"v1"')
+                self.end_headers()
+            else:
+                self.send_body(200, body, "image/png", ETag='"v1"')
+
+    url = f"{serve(Handler)}/sofa.png"
+    store = ImageStore(str(tmp_path))
+
+    first = ImageFetcher(session=requests.Session(), store=store).fetch(url)
+    second = ImageFetcher(session=requests.Session(), store=store).fetch(url)
+
+    assert requests_seen == [None, '"v1"']
+    assert store.load(url)[0] == body
+    assert first.getpixel((0, 0)) == second.getpixel((0, 0)) == (0, 0, 255)
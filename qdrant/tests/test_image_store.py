@@ -0,0 +1,26 @@
+import os
+import time
+
+from vector_search.core.image_store import ImageStore
+
+
+def test_least_recently_used_images_are_evicted_over_budget(tmp_path):
+    store = ImageStore(str(tmp_path), max_bytes=10_000)
+    for i in range(5):
+        store.save(f"https://example.com/{i}.jpg", bytes(1000), {"ETag": f'"{i}"'})
+    # Age the first images so the order doesn't depend on mtime resolution
+    for i in range(5):
+        content_path, _ = store._paths(f"https://example.com/{i}.jpg")
+        os.utime(content_path, (time.time() - 1000 + i, time.time() - 1000 + i))
+    # Loading marks an image as recently used
+    store.load("https://example.com/0.jpg")
+
+    for i in range(5, 11):
+        store.save(f"https://example.com/{i}.jpg", bytes(1000), {})
+
+    assert store.size_bytes() <= 0.9 * store.max_bytes
+    assert store.load("https://example.com/0.jpg") is not None
+    assert store.load("https://example.com/1.jpg") is None
+    assert store.load("https://example.com/2.jpg") is None
+    assert store.load("https://example.com/3.jpg") is not None
+    assert store.load("https://example.com/10.jpg") is not None
@@ -0,0 +1,43 @@
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC_PATH = Path(__file__).parent.parent / "src"
+
+# Loaded only when the class that needs them is used
+HEAVY_MODULES = ["torch", "transformers", "openai", "qdrant_client", "dotenv"]
+
+# Median over several imports, including interpreter start
+IMPORT_BUDGET = 0.5
+
+PROBE = f"""
+import json, sys
+sys.path.insert(0, {str(SRC_PATH)!r})
+import vector_search
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def import_package() -> list:
+    result = subprocess.run([sys.executable, "-c", PROBE], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def test_import_does_not_load_heavy_modules():
+    modules = import_package()
+
+    assert "vector_search" in modules
+    assert [module for module in HEAVY_MODULES if module in modules] == []
+
+
+def test_import_is_within_budget():
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        import_package()
+        timings.append(time.perf_counter() - start)
+
+    assert statistics.median(timings) < IMPORT_BUDGET
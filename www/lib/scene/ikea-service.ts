@@ -9,6 +9,9 @@ import { generateUUID } from "../utils";
 import Replicate from "replicate";
 import sharp from "sharp";
 
+// Holds per-collection settings written by the Python vector_search package
+const METADATA_COLLECTION = "_collection_metadata";
+
 interface Segment {
   id: string;
   bbox: number[];
@@ -194,9 +197,16 @@ export class IkeaService {
     return !!(process.env.QDRANT_URL && process.env.QDRANT_API_KEY);
   }
 
+  async getCollections(): Promise<string[]> {
+    const { collections } = await this.qdrant.getCollections();
+    return collections
+      .map((collection) => collection.name)
+      .filter((name) => name !== METADATA_COLLECTION);
+  }
+
   async testConnection(): Promise<boolean> {
     try {
-      await this.qdrant.getCollections();
+      await this.getCollections();
       return true;
     } catch {
       return false;